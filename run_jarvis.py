@@ -15,15 +15,15 @@ if __name__ == "__main__":
     from src.core.logger_config import init_jarvis_logging
     init_jarvis_logging(debug=False)  # Set to True for verbose logging
     
-    # Import and create JARVIS
-    from main import JarvisAgent
-    
     print("\n" + "="*70)
     print(" "*20 + "JARVIS - Console Mode")
     print("="*70)
     print("\nStarting JARVIS in console mode...")
     print("Say 'Hey JARVIS' to activate\n")
     
+    # Heavy imports after the banner so it shows immediately
+    from main import JarvisAgent
+    
     # Start JARVIS
     jarvis = JarvisAgent(use_wake_word=True)
     jarvis.run()
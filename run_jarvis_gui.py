@@ -15,15 +15,15 @@ if __name__ == "__main__":
     from src.core.logger_config import init_jarvis_logging
     init_jarvis_logging(debug=False)  # Set to True for verbose logging
     
-    # Import and run GUI
-    from src.modules.gui_app import JarvisGui
-    
     print("\n" + "="*70)
     print(" "*20 + "JARVIS - GUI Mode")
     print("="*70)
     print("\nLaunching JARVIS GUI...")
     print("Click 'Start System' in the window to begin\n")
     
+    # Heavy imports after the banner so it shows immediately
+    from src.modules.gui_app import JarvisGui
+    
     # Start GUI
     app = JarvisGui()
     app.mainloop()
@@ -1,9 +1,8 @@
 import customtkinter as ctk
 import time
-import math
+import numpy as np
 import psutil
 import threading
-import random
 import queue
 import sys
 import os
@@ -12,36 +11,36 @@ from datetime import datetime
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from main import JarvisAgent
 from src.modules.feedback_system import FeedbackSystem
+from src.utils.tk_wake import TkWakeQueue
 
 class HudFeedback(FeedbackSystem):
-    def __init__(self, update_queue):
+    def __init__(self, post_update):
         super().__init__()
-        self.update_queue = update_queue
+        self.post_update = post_update
         
     def print_status(self, message, status="info"):
-        self.update_queue.put(("status", message, status))
+        self.post_update(("status", message, status))
         super().print_status(message, status)
 
     def print_command(self, text):
-        self.update_queue.put(("user", text))
+        self.post_update(("user", text))
         super().print_command(text)
 
     def print_action(self, action, target):
-        self.update_queue.put(("action", f"{action} -> {target}"))
+        self.post_update(("action", f"{action} -> {target}"))
         super().print_action(action, target)
         
     def show_thinking(self):
-        self.update_queue.put(("state", "Thinking..."))
+        self.post_update(("state", "Thinking..."))
         super().show_thinking()
         
     def clear_thinking(self):
-        self.update_queue.put(("state", "Ready"))
+        self.post_update(("state", "Ready"))
         super().clear_thinking()
 
     def activation_beep(self):
-        self.update_queue.put(("state", "Listening..."))
+        self.post_update(("state", "Listening..."))
         super().activation_beep()
 
 class JarvisHUD(ctk.CTk):
@@ -83,29 +82,67 @@ class JarvisHUD(ctk.CTk):
         self.amplitude = 0
         self.status_text = "SYSTEM ONLINE"
         self.status_color = self.color_primary
+        self.rotation_speed = 5
+        
+        # Status color and reactor speed per agent state; anything else uses the default
+        self._state_styles = {
+            "LISTENING...": (self.color_success, 15),
+            "THINKING...": ("#ffaa00", 25), # Orange
+        }
+        self._default_style = (self.color_primary, 5)
+        
+        # Fonts
+        self._font_small = ("Consolas", 10)
+        self._font_status = ("Consolas", 12, "bold")
+        self._font_clock = ("Consolas", 32, "bold")
+        self._font_date = ("Consolas", 14)
+        self._font_message = ("Consolas", 14)
+        self._font_message_italic = ("Consolas", 14, "italic")
         self.last_user_text = ""
         self.last_jarvis_text = ""
         
+        # Visualizer lanes: x offsets and sine phase per lane, computed once
+        self._lane_i = np.arange(-30, 31)
+        self._lane_x_off = self._lane_i * 10
+        # Ring of prebuilt noise; each frame reads the next 61 values
+        self._noise = np.random.uniform(0.8, 1.2, 1024)
+        self._noise_lanes = np.arange(len(self._lane_i))
+        self._noise_idx = 0
+        
+        # psutil is sampled at 2 Hz; the stat items keep showing the last sample
+        self._last_stat_ts = 0
+        
         # Agent Integration
-        self.update_queue = queue.Queue()
+        # put() wakes the Tk thread to apply the update (Tk calls aren't safe
+        # from the agent thread)
+        self.update_queue = TkWakeQueue(self, self.check_queue)
+        # Latest mic level; only the newest value matters, so it skips the queue
+        self._latest_amplitude = None
         self.agent_thread = threading.Thread(target=self.run_agent, daemon=True)
         self.agent_thread.start()
         
         # Start Animations
+        self.create_items()
         self.animate()
-        self.check_queue()
         
         # Bind escape to quit
         self.bind("<Escape>", lambda e: self.destroy())
 
+    def post_update(self, msg):
+        """Queue an update from the agent thread and wake the Tk mainloop"""
+        self.update_queue.put(msg)
+
     def on_amplitude_update(self, amplitude):
-        try:
-            self.update_queue.put(("amplitude", amplitude))
-        except:
-            pass
+        # Coalesced: the Tk thread picks up only the latest value per wake-up
+        self._latest_amplitude = amplitude
+        self.update_queue.wake()
 
     def run_agent(self):
-        feedback = HudFeedback(self.update_queue)
+        # Imported here, on the agent thread, so the HUD window is up before
+        # the whole assistant stack (STT, TTS, LLM clients) finishes loading
+        from main import JarvisAgent
+        
+        feedback = HudFeedback(self.post_update)
         try:
             self.agent = JarvisAgent(
                 use_wake_word=True, 
@@ -114,108 +151,156 @@ class JarvisHUD(ctk.CTk):
             )
             self.agent.run()
         except Exception as e:
-            self.update_queue.put(("error", str(e)))
+            self.post_update(("error", str(e)))
 
     def check_queue(self):
-        try:
-            while True:
+        """Apply updates posted by the agent thread since the last wake-up"""
+        amplitude, self._latest_amplitude = self._latest_amplitude, None
+        if amplitude is not None:
+            self.amplitude = amplitude
+        self._drain_queue()
+
+    def _drain_queue(self):
+        while True:
+            try:
                 msg_type, *data = self.update_queue.get_nowait()
-                
-                if msg_type == "amplitude":
-                    self.amplitude = data[0]
-                    
-                elif msg_type == "state":
-                    self.status_text = data[0].upper()
-                    if "LISTENING" in self.status_text:
-                        self.status_color = self.color_success
-                    elif "THINKING" in self.status_text:
-                        self.status_color = "#ffaa00" # Orange
-                    else:
-                        self.status_color = self.color_primary
-                        
-                elif msg_type == "user":
-                    self.last_user_text = f"YOU: {data[0]}"
+            except queue.Empty:
+                return
+            
+            if msg_type == "state":
+                self.status_text = data[0].upper()
+                self.status_color, self.rotation_speed = self._state_styles.get(
+                    self.status_text, self._default_style
+                )
                     
-                elif msg_type == "status":
-                    msg, status = data
-                    if status == "success":
-                        self.last_jarvis_text = f"JARVIS: {msg}"
-                        
-        except queue.Empty:
-            pass
+            elif msg_type == "user":
+                self.last_user_text = f"YOU: {data[0]}"
+                
+            elif msg_type == "status":
+                msg, status = data
+                if status == "success":
+                    self.last_jarvis_text = f"JARVIS: {msg}"
+
+    def create_items(self):
+        """Create every canvas item once; animate() only moves and recolors them"""
+        w = self.winfo_screenwidth()
+        h = self.winfo_screenheight()
+        
+        # Arc reactor
+        cx, cy = 100, h-100
+        radius = 60
+        inner_r = 45
+        self._reactor_outer = self.canvas.create_oval(
+            cx-radius, cy-radius, cx+radius, cy+radius,
+            outline=self.status_color, width=2
+        )
+        self._reactor_arcs = [
+            self.canvas.create_arc(
+                cx-inner_r, cy-inner_r, cx+inner_r, cy+inner_r,
+                start=i * 120, extent=60,
+                outline=self.status_color, width=5, style="arc"
+            )
+            for i in range(3)
+        ]
+        self._reactor_core = self.canvas.create_oval(
+            cx-10, cy-10, cx+10, cy+10,
+            fill=self.status_color, outline=""
+        )
+        self._reactor_text = self.canvas.create_text(
+            cx, cy+80,
+            text=self.status_text,
+            fill=self.status_color,
+            font=self._font_status
+        )
+        
+        # System stats
+        x, y = 100, 100
+        self._cpu_arc = self.create_circle_progress(x, y, 40, self.color_primary)
+        self._cpu_text = self.canvas.create_text(x, y, text="", fill=self.color_primary, font=self._font_small)
+        self._ram_arc = self.create_circle_progress(x+100, y, 40, self.color_primary)
+        self._ram_text = self.canvas.create_text(x+100, y, text="", fill=self.color_primary, font=self._font_small)
+        
+        # Clock
+        x = w - 150
+        y = 80
+        self._time_text = self.canvas.create_text(x, y, text="", fill=self.color_primary, font=self._font_clock)
+        self._date_text = self.canvas.create_text(x, y+30, text="", fill=self.color_secondary, font=self._font_date)
+        
+        # Visualizer (61 points, positioned every frame)
+        self._visualizer_line = self.canvas.create_line(
+            *([0] * 122), fill=self.status_color, width=2, smooth=True
+        )
         
-        self.after(50, self.check_queue)
+        # Messages
+        self._user_text = self.canvas.create_text(
+            w // 2, h - 200,
+            text="",
+            fill=self.color_primary,
+            font=self._font_message,
+            width=600, justify="center"
+        )
+        self._jarvis_text = self.canvas.create_text(
+            w // 2, h - 170,
+            text="",
+            fill="#ffffff",
+            font=self._font_message_italic,
+            width=600, justify="center"
+        )
+        
+        # Frame lines never change
+        self.canvas.create_line(0, 50, w, 50, fill=self.color_secondary, width=1)
+        self.canvas.create_line(0, h-50, w, h-50, fill=self.color_secondary, width=1)
 
-    def draw_circle_progress(self, x, y, radius, percentage, color, width=2):
+    def create_circle_progress(self, x, y, radius, color, width=2):
+        """Create the track and progress arc; returns the arc id to update"""
         self.canvas.create_oval(
             x-radius, y-radius, x+radius, y+radius,
             outline=self.color_secondary, width=width
         )
-        extent = -(percentage / 100) * 360
-        self.canvas.create_arc(
+        return self.canvas.create_arc(
             x-radius, y-radius, x+radius, y+radius,
-            start=90, extent=extent,
+            start=90, extent=0,
             outline=color, width=width, style="arc"
         )
 
-    def draw_arc_reactor(self, cx, cy):
-        radius = 60
-        
+    def draw_circle_progress(self, arc, percentage):
+        extent = -(percentage / 100) * 360
+        self.canvas.itemconfigure(arc, extent=extent)
+
+    def draw_arc_reactor(self):
         # Color based on status
         color = self.status_color
         
-        self.canvas.create_oval(
-            cx-radius, cy-radius, cx+radius, cy+radius,
-            outline=color, width=2
-        )
-        
-        inner_r = 45
+        self.canvas.itemconfigure(self._reactor_outer, outline=color)
         
         # Rotate faster if active
-        rotation_speed = 5
-        if "LISTENING" in self.status_text: rotation_speed = 15
-        if "THINKING" in self.status_text: rotation_speed = 25
-        
-        self.angle = (self.angle + rotation_speed) % 360
+        self.angle = (self.angle + self.rotation_speed) % 360
         
-        for i in range(3):
+        for i, arc in enumerate(self._reactor_arcs):
             start_angle = self.angle + (i * 120)
-            self.canvas.create_arc(
-                cx-inner_r, cy-inner_r, cx+inner_r, cy+inner_r,
-                start=start_angle, extent=60,
-                outline=color, width=5, style="arc"
-            )
+            self.canvas.itemconfigure(arc, start=start_angle, outline=color)
             
-        self.canvas.create_oval(
-            cx-10, cy-10, cx+10, cy+10,
-            fill=color, outline=""
-        )
-        
-        self.canvas.create_text(
-            cx, cy+80,
-            text=self.status_text,
-            fill=color,
-            font=("Consolas", 12, "bold")
-        )
+        self.canvas.itemconfigure(self._reactor_core, fill=color)
+        self.canvas.itemconfigure(self._reactor_text, text=self.status_text, fill=color)
 
     def draw_system_stats(self):
+        now = time.monotonic()
+        if now - self._last_stat_ts < 0.5:
+            return
+        self._last_stat_ts = now
         cpu = psutil.cpu_percent()
         ram = psutil.virtual_memory().percent
-        x, y = 100, 100
-        self.draw_circle_progress(x, y, 40, cpu, self.color_primary)
-        self.canvas.create_text(x, y, text=f"CPU\n{int(cpu)}%", fill=self.color_primary, font=("Consolas", 10))
-        self.draw_circle_progress(x+100, y, 40, ram, self.color_primary)
-        self.canvas.create_text(x+100, y, text=f"RAM\n{int(ram)}%", fill=self.color_primary, font=("Consolas", 10))
+        self.draw_circle_progress(self._cpu_arc, cpu)
+        self.canvas.itemconfigure(self._cpu_text, text=f"CPU\n{int(cpu)}%")
+        self.draw_circle_progress(self._ram_arc, ram)
+        self.canvas.itemconfigure(self._ram_text, text=f"RAM\n{int(ram)}%")
 
     def draw_clock(self):
         now = datetime.now()
         time_str = now.strftime("%H:%M:%S")
         date_str = now.strftime("%Y-%m-%d")
-        w = self.winfo_screenwidth()
-        x = w - 150
-        y = 80
-        self.canvas.create_text(x, y, text=time_str, fill=self.color_primary, font=("Consolas", 32, "bold"))
-        self.canvas.create_text(x, y+30, text=date_str, fill=self.color_secondary, font=("Consolas", 14))
+        self.canvas.itemconfigure(self._time_text, text=time_str)
+        self.canvas.itemconfigure(self._date_text, text=date_str)
 
     def draw_visualizer(self):
         w = self.winfo_screenwidth()
@@ -223,61 +308,33 @@ class JarvisHUD(ctk.CTk):
         cx = w // 2
         cy = h - 100
         
-        points = []
         # Use real amplitude to modulate wave height
         base_height = 5 + (self.amplitude * 1.5) # Scale amplitude
         
-        for i in range(-30, 31):
-            x = cx + (i * 10)
-            # Sine wave with noise
-            noise = random.uniform(0.8, 1.2)
-            height = base_height * math.sin((self.angle + i*10) * 0.1) * noise
-            points.append(x)
-            points.append(cy + height)
+        # Sine wave with noise, all 61 lanes at once
+        idx = self._noise_idx
+        self._noise_idx = (idx + len(self._lane_i)) % len(self._noise)
+        noise = self._noise.take(idx + self._noise_lanes, mode="wrap")
+        heights = base_height * np.sin(self.angle * 0.1 + self._lane_i) * noise
+        points = np.column_stack((cx + self._lane_x_off, cy + heights)).ravel().tolist()
             
-        if len(points) > 4:
-            self.canvas.create_line(points, fill=self.status_color, width=2, smooth=True)
+        self.canvas.coords(self._visualizer_line, points)
+        self.canvas.itemconfigure(self._visualizer_line, fill=self.status_color)
 
     def draw_messages(self):
         # Display last user and jarvis messages
-        w = self.winfo_screenwidth()
-        h = self.winfo_screenheight()
-        cx = w // 2
-        
-        if self.last_user_text:
-            self.canvas.create_text(
-                cx, h - 200,
-                text=self.last_user_text,
-                fill=self.color_primary,
-                font=("Consolas", 14),
-                width=600, justify="center"
-            )
-            
-        if self.last_jarvis_text:
-            self.canvas.create_text(
-                cx, h - 170,
-                text=self.last_jarvis_text,
-                fill="#ffffff",
-                font=("Consolas", 14, "italic"),
-                width=600, justify="center"
-            )
+        self.canvas.itemconfigure(self._user_text, text=self.last_user_text)
+        self.canvas.itemconfigure(self._jarvis_text, text=self.last_jarvis_text)
 
     def animate(self):
         if not self.running: return
-        self.canvas.delete("all")
         
-        w = self.winfo_screenwidth()
-        h = self.winfo_screenheight()
-        
-        self.draw_arc_reactor(100, h-100)
+        self.draw_arc_reactor()
         self.draw_system_stats()
         self.draw_clock()
         self.draw_visualizer()
         self.draw_messages()
         
-        self.canvas.create_line(0, 50, w, 50, fill=self.color_secondary, width=1)
-        self.canvas.create_line(0, h-50, w, h-50, fill=self.color_secondary, width=1)
-        
         self.after(50, self.animate)
 
 if __name__ == "__main__":
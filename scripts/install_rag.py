@@ -1,4 +1,5 @@
 
+import os
 import subprocess
 import sys
 
@@ -16,8 +17,17 @@ def install_rag_dependencies():
         "docx2txt"
     ]
     
+    # Skip pip's version check and prompts; take wheels over sdists when both exist
+    pip_cmd = [
+        sys.executable, "-m", "pip", "install",
+        "--prefer-binary",
+        "--disable-pip-version-check",
+        "--no-input",
+    ]
+    env = dict(os.environ, PIP_NO_COLOR="1")
+    
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install"] + packages)
+        subprocess.check_call(pip_cmd + packages, env=env)
         print("\nSUCCESS: All RAG dependencies installed!")
         print("You can now use the Knowledge Base feature.")
     except subprocess.CalledProcessError as e:
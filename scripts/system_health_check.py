@@ -2,9 +2,11 @@
 import sys
 import os
 import time
-import json
+import atexit
+import importlib.util
 import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from colorama import init, Fore, Style
 
 # Add src to path
@@ -13,40 +15,47 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 # Initialize colorama
 init(autoreset=True)
 
+# Checks run in parallel; keep their report lines whole
+_print_lock = threading.Lock()
+
+REPORT_FILE = "system_check_report.txt"
+# Opened once by check_environment() and held for the whole run
+_report_fp = None
+
+CRITICAL_PACKAGES = ("numpy", "sounddevice", "vosk", "faster_whisper", "edge_tts", "openai")
+
 def print_status(component, status, message=""):
     log_line = f"[{status}] {component:<20} {message}"
     
-    # Print to console with color
-    if status == "PASS":
-        print(f"{Fore.GREEN}[PASS] {component:<20} {message}")
-    elif status == "FAIL":
-        print(f"{Fore.RED}[FAIL] {component:<20} {message}")
-    elif status == "WARN":
-        print(f"{Fore.YELLOW}[WARN] {component:<20} {message}")
-    else:
-        print(f"{Fore.CYAN}[INFO] {component:<20} {message}")
-        
-    # Write to file
-    with open("system_check_report.txt", "a", encoding="utf-8") as f:
-        f.write(log_line + "\n")
+    with _print_lock:
+        # Print to console with color
+        if status == "PASS":
+            print(f"{Fore.GREEN}[PASS] {component:<20} {message}")
+        elif status == "FAIL":
+            print(f"{Fore.RED}[FAIL] {component:<20} {message}")
+        elif status == "WARN":
+            print(f"{Fore.YELLOW}[WARN] {component:<20} {message}")
+        else:
+            print(f"{Fore.CYAN}[INFO] {component:<20} {message}")
+            
+        # Write to file
+        if _report_fp is not None:
+            _report_fp.write(log_line + "\n")
 
 def check_environment():
-    # Clear log file
-    with open("system_check_report.txt", "w", encoding="utf-8") as f:
-        f.write("SYSTEM HEALTH CHECK REPORT\n==========================\n")
+    global _report_fp
+    # Start a fresh report and keep it open (line-buffered) for the rest of the run
+    _report_fp = open(REPORT_FILE, "w", encoding="utf-8", buffering=1)
+    atexit.register(_report_fp.close)
+    _report_fp.write("SYSTEM HEALTH CHECK REPORT\n==========================\n")
 
     print_status("Environment", "INFO", "Checking Python environment...")
-    try:
-        import numpy
-        import sounddevice
-        import vosk
-        import faster_whisper
-        import edge_tts
-        import openai
-        print_status("Dependencies", "PASS", "Critical packages installed")
-    except ImportError as e:
-        print_status("Dependencies", "FAIL", f"Missing package: {e}")
+    # find_spec only locates the packages; the real imports happen in the checks below
+    missing = [name for name in CRITICAL_PACKAGES if importlib.util.find_spec(name) is None]
+    if missing:
+        print_status("Dependencies", "FAIL", f"Missing packages: {', '.join(missing)}")
         return False
+    print_status("Dependencies", "PASS", "Critical packages installed")
     return True
 
 def check_wake_word():
@@ -131,11 +140,17 @@ def main():
         print("\nSystem Check Aborted due to environment issues.")
         return
 
-    check_wake_word()
-    check_stt()
-    check_tts()
+    # The model checks are independent, so load them side by side
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = {
+            "wake": pool.submit(check_wake_word),
+            "stt": pool.submit(check_stt),
+            "tts": pool.submit(check_tts),
+            "memory": pool.submit(check_memory),
+        }
+        results = {name: future.result() for name, future in futures.items()}
     
-    memory_ok, memory_manager = check_memory()
+    memory_ok, memory_manager = results["memory"]
     
     if memory_ok:
         check_llm(memory_manager)
@@ -2,7 +2,7 @@
 Multi-Agent System Components
 """
 
-from src.agents.base_agent import BaseAgent, AgentMessage, AgentCapability
+from src.agents.base_agent import BaseAgent, AgentMessage, AgentCapability, AgentRequest
 from src.agents.orchestrator import AgentOrchestrator
 from src.agents.finance_agent import FinanceAgent
 from src.agents.system_agent import SystemAgent
@@ -11,6 +11,7 @@ __all__ = [
     'BaseAgent',
     'AgentMessage',
     'AgentCapability',
+    'AgentRequest',
     'AgentOrchestrator',
     'FinanceAgent',
     'SystemAgent',
@@ -3,17 +3,26 @@ Base Agent Class - Foundation for all specialized agents
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Deque, Callable, Tuple, TypedDict, Union
+from collections import deque
 from datetime import datetime
-import uuid
+import threading
+import time
+import os
+import re
 from src.core.logger_config import get_logger
+from src.utils import fast_json
 
 logger = get_logger(__name__)
 
+MESSAGE_HISTORY_LIMIT = 1024
+
 
 class AgentMessage:
     """Message format for agent-to-agent communication"""
     
+    __slots__ = ("task_id", "from_agent", "to_agent", "msg_type", "content", "priority", "_ts_ns")
+    
     def __init__(self, 
                  from_agent: str,
                  to_agent: str,
@@ -21,13 +30,19 @@ class AgentMessage:
                  msg_type: str = "request",
                  priority: str = "normal",
                  task_id: Optional[str] = None):
-        self.task_id = task_id or str(uuid.uuid4())
+        self.task_id = task_id or os.urandom(16).hex()  # Opaque 128-bit id
         self.from_agent = from_agent
         self.to_agent = to_agent
         self.msg_type = msg_type  # request, response, query, error
         self.content = content
         self.priority = priority  # high, normal, low
-        self.timestamp = datetime.now().isoformat()
+        # Raw creation time; formatted only if someone asks for it
+        self._ts_ns = time.time_ns()
+    
+    @property
+    def timestamp(self) -> str:
+        """Creation time as a local ISO-8601 string"""
+        return datetime.fromtimestamp(self._ts_ns / 1e9).isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary"""
@@ -41,6 +56,10 @@ class AgentMessage:
             "timestamp": self.timestamp
         }
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize the message straight to UTF-8 JSON (orjson when available)"""
+        return fast_json.dumpb(self.to_dict())
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AgentMessage':
         """Create message from dictionary"""
@@ -54,9 +73,41 @@ class AgentMessage:
         )
 
 
+class TaskDict(TypedDict, total=False):
+    """Task description passed to BaseAgent.can_handle"""
+    action: str
+    content: str  # The user's request text; non-str values are ignored
+
+
+class AgentRequest:
+    """
+    Action request for in-process callers (see BaseAgent.process_raw)
+    
+    Slotted replacement for the {"action", "params", "context"} dict that
+    message content carries; agents accept either form.
+    """
+    
+    __slots__ = ("action", "params", "context")
+    
+    def __init__(self, action: Union[str, int], params: Optional[Dict[str, Any]] = None,
+                 context: str = ""):
+        self.action = action
+        self.params = params if params is not None else {}
+        self.context = context
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "action": self.action,
+            "params": self.params,
+            "context": self.context
+        }
+
+
 class AgentCapability:
     """Describes what an agent can do"""
     
+    __slots__ = ("name", "description", "parameters")
+    
     def __init__(self, name: str, description: str, parameters: List[str]):
         self.name = name
         self.description = description
@@ -70,6 +121,17 @@ class AgentCapability:
         }
 
 
+class _MetricsBucket:
+    """Cumulative task counters written by a single thread"""
+    
+    __slots__ = ("completed", "failed", "time_ns")
+    
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.time_ns = 0
+
+
 class BaseAgent(ABC):
     """
     Abstract base class for all agents in the multi-agent system
@@ -85,8 +147,15 @@ class BaseAgent(ABC):
         self.name = name
         self.role = role
         self.capabilities: List[AgentCapability] = []
+        # Serialized capabilities, rebuilt only after register_capability
+        self._capabilities_dict_cache: Optional[List[Dict[str, Any]]] = None
         self.state: Dict[str, Any] = {}
-        self.message_history: List[AgentMessage] = []
+        # Action name -> handler(params); filled in by each subclass
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        # Same handlers indexed by the subclass's IntEnum action ids (optional)
+        self._action_table: Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], ...] = ()
+        # Bounded: keeps the most recent messages and drops the oldest
+        self.message_history: Deque[AgentMessage] = deque(maxlen=MESSAGE_HISTORY_LIMIT)
         self.logger = get_logger(f"agent.{name}")
         
         # Performance metrics
@@ -95,6 +164,11 @@ class BaseAgent(ABC):
             "tasks_failed": 0,
             "average_response_time": 0.0
         }
+        # Each thread that reports metrics gets its own counter bucket, so
+        # update_metrics never takes a lock; readers sum the buckets
+        self._metrics_local = threading.local()
+        self._metrics_buckets: List[_MetricsBucket] = []
+        self._metrics_lock = threading.Lock()
         
         self.logger.info(f"Agent '{name}' initialized with role: {role}")
     
@@ -122,7 +196,7 @@ class BaseAgent(ABC):
         pass
     
     @abstractmethod
-    def can_handle(self, task: Dict[str, Any]) -> float:
+    def can_handle(self, task: TaskDict) -> float:
         """
         Determine if this agent can handle a task
         
@@ -134,14 +208,92 @@ class BaseAgent(ABC):
         """
         pass
     
+    @staticmethod
+    def _content_matches(task: TaskDict, pattern: re.Pattern) -> bool:
+        """
+        True if the task's content is text and (lowercased) matches pattern
+        
+        Only plain-text content is scanned; stringifying a dict or request
+        object would walk its whole repr.
+        """
+        content = task.get("content")
+        return isinstance(content, str) and pattern.search(content.lower()) is not None
+    
+    def _run_action(self, content: Union[AgentRequest, Dict[str, Any]]) -> Tuple[Dict[str, Any], str]:
+        """
+        Dispatch an action request to its handler and record metrics
+        
+        Returns:
+            (result dict, message type: "response" or "error")
+        """
+        start_ns = time.perf_counter_ns()
+        
+        try:
+            if isinstance(content, AgentRequest):
+                action = content.action
+                params = content.params
+            else:
+                action = content.get("action")
+                params = content.get("params", {})
+            
+            self.logger.info(f"Processing action: {action}")
+            
+            # Route to appropriate handler; in-process callers may pass an
+            # IntEnum action id, which indexes straight into the action table
+            if isinstance(action, int):
+                table = self._action_table
+                handler = table[action] if 0 <= action < len(table) else None
+            else:
+                handler = self._handlers.get(action)
+            if handler:
+                result = handler(params)
+            else:
+                result = {
+                    "success": False,
+                    "message": f"Unknown action: {action}"
+                }
+            msg_type = "response"
+            
+        except Exception as e:
+            self.logger.error(f"Error processing message: {e}")
+            result = {
+                "success": False,
+                "message": f"Error: {str(e)}"
+            }
+            msg_type = "error"
+        
+        # Update metrics
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        self.update_metrics(success=result.get("success", False), 
+                            response_time_ns=elapsed_ns)
+        
+        return result, msg_type
+    
+    def process_raw(self, content: Union[AgentRequest, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Execute an action and return the result dict directly
+        
+        Same work as process_message, minus the request/response AgentMessage
+        wrappers and the message_history entry. For in-process callers.
+        """
+        return self._run_action(content)[0]
+    
     def register_capability(self, name: str, description: str, parameters: List[str]):
         """Register a new capability for this agent"""
         capability = AgentCapability(name, description, parameters)
         self.capabilities.append(capability)
+        self._capabilities_dict_cache = None
         self.logger.info(f"Registered capability: {name}")
     
+    def get_capabilities_dict(self) -> List[Dict[str, Any]]:
+        """Capabilities as dicts (cached; treat the result as read-only)"""
+        if self._capabilities_dict_cache is None:
+            self._capabilities_dict_cache = [cap.to_dict() for cap in self.get_capabilities()]
+        return self._capabilities_dict_cache
+    
     def send_message(self, to_agent: str, content: Dict[str, Any], 
-                     msg_type: str = "request") -> AgentMessage:
+                     msg_type: str = "request",
+                     task_id: Optional[str] = None) -> AgentMessage:
         """
         Create a message to send to another agent
         
@@ -149,6 +301,7 @@ class BaseAgent(ABC):
             to_agent: Target agent name
             content: Message content
             msg_type: Type of message
+            task_id: Task this message belongs to (a new id if omitted)
             
         Returns:
             Created message
@@ -157,24 +310,57 @@ class BaseAgent(ABC):
             from_agent=self.name,
             to_agent=to_agent,
             content=content,
-            msg_type=msg_type
+            msg_type=msg_type,
+            task_id=task_id
         )
         self.message_history.append(message)
         return message
     
-    def update_metrics(self, success: bool, response_time: float):
-        """Update agent performance metrics"""
+    def update_metrics(self, success: bool, response_time_ns: int):
+        """Record a finished task in the calling thread's bucket"""
+        try:
+            bucket = self._metrics_local.bucket
+        except AttributeError:
+            bucket = self._new_metrics_bucket()
+        
         if success:
-            self.metrics["tasks_completed"] += 1
+            bucket.completed += 1
         else:
-            self.metrics["tasks_failed"] += 1
-        
-        # Update average response time
-        total_tasks = self.metrics["tasks_completed"] + self.metrics["tasks_failed"]
-        current_avg = self.metrics["average_response_time"]
-        self.metrics["average_response_time"] = (
-            (current_avg * (total_tasks - 1) + response_time) / total_tasks
-        )
+            bucket.failed += 1
+        bucket.time_ns += response_time_ns
+    
+    def _new_metrics_bucket(self) -> "_MetricsBucket":
+        bucket = _MetricsBucket()
+        with self._metrics_lock:
+            self._metrics_buckets.append(bucket)
+        self._metrics_local.bucket = bucket
+        return bucket
+    
+    def _flush_metrics(self):
+        """Sum every thread's bucket into self.metrics"""
+        with self._metrics_lock:
+            buckets = list(self._metrics_buckets)
+            
+            # Buckets only ever grow and each has a single writer, so a plain
+            # sum is safe without stopping the writers
+            completed = sum(bucket.completed for bucket in buckets)
+            failed = sum(bucket.failed for bucket in buckets)
+            time_ns = sum(bucket.time_ns for bucket in buckets)
+            
+            metrics = self.metrics
+            metrics["tasks_completed"] = completed
+            metrics["tasks_failed"] = failed
+            
+            # Update average response time
+            total_tasks = completed + failed
+            if total_tasks:
+                metrics["average_response_time"] = time_ns / total_tasks / 1e9
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the performance metrics"""
+        self._flush_metrics()
+        with self._metrics_lock:
+            return dict(self.metrics)
     
     def get_status(self) -> Dict[str, Any]:
         """Get current agent status"""
@@ -182,8 +368,8 @@ class BaseAgent(ABC):
             "name": self.name,
             "role": self.role,
             "state": self.state,
-            "capabilities": [cap.to_dict() for cap in self.capabilities],
-            "metrics": self.metrics
+            "capabilities": self.get_capabilities_dict(),
+            "metrics": self.get_metrics()
         }
     
     def reset_state(self):
@@ -191,5 +377,8 @@ class BaseAgent(ABC):
         self.state = {}
         self.logger.info(f"Agent '{self.name}' state reset")
     
+    def close(self):
+        """Release resources held by the agent (worker threads, databases); no-op by default"""
+    
     def __repr__(self):
         return f"<{self.__class__.__name__}(name='{self.name}', role='{self.role}')>"
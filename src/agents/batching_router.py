@@ -0,0 +1,96 @@
+"""
+Batching Router - Collects routing requests that arrive together and
+decides them with one LLM call
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.logger_config import get_logger
+
+logger = get_logger(__name__)
+
+RouteOne = Callable[[str], Dict[str, Any]]
+RouteMany = Callable[[List[str]], List[Dict[str, Any]]]
+
+
+class BatchingRouter:
+    """
+    Background thread that micro-batches routing decisions
+
+    Requests queued within `window` seconds of each other (up to
+    `max_batch`) share one LLM call via `route_many`; a lone request goes
+    through `route_one` with the normal single-request prompt.
+    """
+
+    def __init__(self, route_one: RouteOne, route_many: RouteMany,
+                 max_batch: int = 8, window: float = 0.01):
+        self.route_one = route_one
+        self.route_many = route_many
+        self.max_batch = max_batch
+        self.window = window
+
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="router", daemon=True)
+        self._thread.start()
+
+    def submit(self, user_input: str) -> Future:
+        """Queue a request; the future resolves to its routing decision"""
+        future: Future = Future()
+        self._queue.put((user_input, future))
+        return future
+
+    def close(self):
+        """Stop the batching thread once already queued requests are decided"""
+        self._queue.put(None)
+        self._thread.join(timeout=1.0)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.window
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: List[tuple]):
+        inputs = [user_input for user_input, _ in batch]
+
+        if len(batch) > 1:
+            try:
+                decisions = self.route_many(inputs)
+                if len(decisions) != len(batch):
+                    raise ValueError(f"expected {len(batch)} decisions, got {len(decisions)}")
+                for (_, future), decision in zip(batch, decisions):
+                    future.set_result(decision)
+                return
+            except Exception as e:
+                # One malformed batch answer shouldn't sink every request in it
+                logger.warning(f"Batched routing failed ({e}), routing {len(batch)} requests one by one")
+
+        for user_input, future in batch:
+            try:
+                future.set_result(self.route_one(user_input))
+            except Exception as e:
+                future.set_exception(e)
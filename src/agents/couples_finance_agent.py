@@ -11,10 +11,33 @@ from pathlib import Path
 if __name__ == "__main__":
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from typing import Dict, Any, List
-from src.agents.base_agent import BaseAgent, AgentMessage, AgentCapability
-from src.modules.couples_finance_manager import CouplesFinanceManager
-import time
+import copy
+import re
+import threading
+from enum import IntEnum
+from typing import Dict, Any, List, Callable
+from src.agents.base_agent import BaseAgent, AgentMessage, AgentCapability, TaskDict
+from src.utils.ttl_cache import TTLCache
+
+
+# Any of these substrings marks a task as finance-related; matched in a
+# single regex pass rather than one `in` scan per keyword
+_FINANCE_KEYWORDS = frozenset((
+    "expense", "spending", "budget", "money", "cost",
+    "price", "finance", "track", "analyze", "spent",
+    "owe", "owes", "settle", "split", "shared"
+))
+_FINANCE_RE = re.compile("|".join(map(re.escape, sorted(_FINANCE_KEYWORDS))))
+
+
+class CouplesFinanceAction(IntEnum):
+    """Integer action ids for in-process callers (names mirror the action strings)"""
+    TRACK_EXPENSE = 0
+    ANALYZE_SPENDING = 1
+    CALCULATE_BALANCE = 2
+    SETTLE_UP = 3
+    SET_BUDGET = 4
+    CHECK_BUDGET_STATUS = 5
 
 
 class CouplesFinanceAgent(BaseAgent):
@@ -29,60 +52,83 @@ class CouplesFinanceAgent(BaseAgent):
     - Savings goals
     """
     
+    # (name, description, parameters) for each capability this agent offers
+    CAPABILITIES = (
+        ("track_expense", "Log an expense for a user (personal or shared)",
+         ("user_name", "amount", "currency", "category", "description", "type", "split_ratio")),
+        ("analyze_spending", "Analyze spending for user(s)",
+         ("user_name", "category", "timeframe")),
+        ("calculate_balance", "Calculate who owes who", ()),
+        ("settle_up", "Mark current balance as settled",
+         ("note",)),
+        ("set_budget", "Set a budget (personal or shared)",
+         ("category", "amount", "period", "budget_type", "user_name")),
+        ("check_budget_status", "Check budget status",
+         ("category",)),
+    )
+    
+    # Read-only actions whose results are reused for identical params
+    CACHEABLE_ACTIONS = frozenset(("analyze_spending", "calculate_balance", "check_budget_status"))
+    # Actions that change the data those results were computed from
+    WRITE_ACTIONS = frozenset(("track_expense", "settle_up", "set_budget"))
+    READ_CACHE_TTL = 30.0  # seconds
+    READ_CACHE_SIZE = 64
+    
     def __init__(self):
         super().__init__(name="couples_finance_agent", role="Couples Financial Advisor")
         
-        # Initialize couples finance tools
-        self.finance_manager = CouplesFinanceManager()
+        # Finance manager is created lazily (see the finance_manager property);
+        # the lock keeps pool threads from each opening their own database
+        self._finance_manager = None
+        self._lazy_lock = threading.Lock()
+        
+        # Action name -> handler, looked up once per message
+        self._handlers = {
+            "track_expense": self._track_expense,
+            "analyze_spending": self._analyze_spending,
+            "calculate_balance": self._calculate_balance,
+            "settle_up": self._settle_up,
+            "set_budget": self._set_budget,
+            "check_budget_status": self._check_budget_status,
+        }
+        
+        # (action, params) -> result; any write action clears it. Writes also
+        # bump the generation, so a read that overlapped a write (agents run
+        # on a thread pool) never stores what it saw before the write.
+        self._read_cache = TTLCache(maxsize=self.READ_CACHE_SIZE, ttl=self.READ_CACHE_TTL)
+        self._cache_generation = 0
+        self._cache_lock = threading.Lock()
+        for action in self.CACHEABLE_ACTIONS:
+            self._handlers[action] = self._cached_read(action, self._handlers[action])
+        for action in self.WRITE_ACTIONS:
+            self._handlers[action] = self._invalidating(self._handlers[action])
+        self._action_table = tuple(self._handlers[action.name.lower()] for action in CouplesFinanceAction)
         
         # Register capabilities
         self._register_capabilities()
         
         self.logger.info("Couples Finance Agent ready")
     
+    @property
+    def finance_manager(self):
+        """Couples finance database, opened on first use"""
+        if self._finance_manager is None:
+            with self._lazy_lock:
+                if self._finance_manager is None:
+                    from src.modules.couples_finance_manager import CouplesFinanceManager
+                    self._finance_manager = CouplesFinanceManager()
+        return self._finance_manager
+    
     def _register_capabilities(self):
         """Register all financial capabilities"""
-        self.register_capability(
-            name="track_expense",
-            description="Log an expense for a user (personal or shared)",
-            parameters=["user_name", "amount", "currency", "category", "description", "type", "split_ratio"]
-        )
-        
-        self.register_capability(
-            name="analyze_spending",
-            description="Analyze spending for user(s)",
-            parameters=["user_name", "category", "timeframe"]
-        )
-        
-        self.register_capability(
-            name="calculate_balance",
-            description="Calculate who owes who",
-            parameters=[]
-        )
-        
-        self.register_capability(
-            name="settle_up",
-            description="Mark current balance as settled",
-            parameters=["note"]
-        )
-        
-        self.register_capability(
-            name="set_budget",
-            description="Set a budget (personal or shared)",
-            parameters=["category", "amount", "period", "budget_type", "user_name"]
-        )
-        
-        self.register_capability(
-            name="check_budget_status",
-            description="Check budget status",
-            parameters=["category"]
-        )
+        for name, description, parameters in self.CAPABILITIES:
+            self.register_capability(name, description, list(parameters))
     
     def get_capabilities(self) -> List[AgentCapability]:
         """Return list of capabilities"""
         return self.capabilities
     
-    def can_handle(self, task: Dict[str, Any]) -> float:
+    def can_handle(self, task: TaskDict) -> float:
         """
         Determine if this agent can handle a task
         
@@ -91,18 +137,11 @@ class CouplesFinanceAgent(BaseAgent):
         action = task.get("action", "").lower()
         
         # High confidence for explicit finance actions
-        finance_keywords = [
-            "expense", "spending", "budget", "money", "cost", 
-            "price", "finance", "track", "analyze", "spent",
-            "owe", "owes", "settle", "split", "shared"
-        ]
-        
-        if any(keyword in action for keyword in finance_keywords):
+        if _FINANCE_RE.search(action):
             return 0.95
         
         # Check content for finance-related terms
-        content = str(task.get("content", "")).lower()
-        if any(keyword in content for keyword in finance_keywords):
+        if self._content_matches(task, _FINANCE_RE):
             return 0.75
         
         return 0.0
@@ -117,62 +156,49 @@ class CouplesFinanceAgent(BaseAgent):
         Returns:
             Response message with results
         """
-        start_time = time.time()
+        result, msg_type = self._run_action(message.content)
         
-        try:
-            content = message.content
-            action = content.get("action")
-            params = content.get("params", {})
-            
-            self.logger.info(f"Processing action: {action}")
-            
-            # Route to appropriate handler
-            if action == "track_expense":
-                result = self._track_expense(params)
-            elif action == "analyze_spending":
-                result = self._analyze_spending(params)
-            elif action == "calculate_balance":
-                result = self._calculate_balance(params)
-            elif action == "settle_up":
-                result = self._settle_up(params)
-            elif action == "set_budget":
-                result = self._set_budget(params)
-            elif action == "check_budget_status":
-                result = self._check_budget_status(params)
-            else:
-                result = {
-                    "success": False,
-                    "message": f"Unknown action: {action}"
-                }
-            
-            # Update metrics
-            response_time = time.time() - start_time
-            self.update_metrics(success=result.get("success", False), 
-                              response_time=response_time)
-            
-            # Create response message
-            response = self.send_message(
-                to_agent=message.from_agent,
-                content=result,
-                msg_type="response"
-            )
-            response.task_id = message.task_id
+        # Create response message
+        return self.send_message(
+            to_agent=message.from_agent,
+            content=result,
+            msg_type=msg_type,
+            task_id=message.task_id
+        )
+    
+    def _cached_read(self, action: str, handler: Callable) -> Callable:
+        """Wrap a read-only handler with the short-lived result cache"""
+        def cached(params: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                key = (action, tuple(sorted(params.items())))
+                hash(key)
+            except TypeError:
+                return handler(params)  # Nested params; not worth caching
             
-            return response
+            # Callers get their own copy, so mutating a result can't poison the cache
+            cached_result = self._read_cache.get(key)
+            if cached_result is not None:
+                return copy.deepcopy(cached_result)
             
-        except Exception as e:
-            self.logger.error(f"Error processing message: {e}")
-            response_time = time.time() - start_time
-            self.update_metrics(success=False, response_time=response_time)
-            
-            return self.send_message(
-                to_agent=message.from_agent,
-                content={
-                    "success": False,
-                    "message": f"Error: {str(e)}"
-                },
-                msg_type="error"
-            )
+            generation = self._cache_generation
+            result = handler(params)
+            if result.get("success"):
+                with self._cache_lock:
+                    if generation == self._cache_generation:
+                        self._read_cache.set(key, copy.deepcopy(result))
+            return result
+        return cached
+    
+    def _invalidating(self, handler: Callable) -> Callable:
+        """Wrap a write handler so cached reads are dropped once the write is done"""
+        def invalidating(params: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return handler(params)
+            finally:
+                with self._cache_lock:
+                    self._cache_generation += 1
+                    self._read_cache.clear()
+        return invalidating
     
     def _track_expense(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Track an expense"""
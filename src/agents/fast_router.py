@@ -0,0 +1,163 @@
+"""
+Fast Router - Routes obvious requests without asking the LLM
+
+Two tiers, tried in order:
+1. Keyword rules: the templated commands shared with LLMCore's quick
+   intents (src/core/quick_intents.COMMAND_RULES), mapped onto agent
+   actions ("open chrome", "I spent $50 on food").
+2. Embedding match: cosine similarity between the request and every
+   capability description, for actions that work with default params.
+   Only tried when the request carries nothing that looks like a param,
+   since an embedding match can't extract one.
+
+Anything below the confidence thresholds, or whose captured params don't
+validate, returns None and goes to the LLM.
+"""
+
+import re
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from src.core.logger_config import get_logger
+from src.core.quick_intents import match_command, normalize_command
+
+logger = get_logger(__name__)
+
+MIN_EMBEDDING_SIMILARITY = 0.7
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Templated command -> (agent, action, command param -> action param)
+KEYWORD_ROUTES = {
+    "open_app": ("system_agent", "open_application", {"app": "app_name"}),
+    "close_app": ("system_agent", "close_application", {"app": "app_name"}),
+    "search": ("system_agent", "search_web", {"query": "query"}),
+    "system": ("system_agent", "system_control", {"command": "command"}),
+    "track_expense": ("finance_agent", "track_expense", {"amount": "amount", "category": "category"}),
+}
+
+# Actions whose handlers have a default for every parameter, so an
+# embedding match alone (no extracted params) is enough to run them
+DEFAULTABLE_ACTIONS = frozenset((
+    ("finance_agent", "analyze_spending"),
+    ("finance_agent", "generate_report"),
+    ("couples_finance_agent", "analyze_spending"),
+    ("couples_finance_agent", "calculate_balance"),
+))
+
+# Numbers, timeframes or "on/for <something>": the request narrows the
+# action down, which an embedding match would silently drop
+_PARAM_HINT_RE = re.compile(
+    r"\d|\b(?:today|yesterday|week|month|year|daily|weekly|monthly|yearly|since|"
+    r"on|for|at|in|about|between)\b"
+)
+
+
+class FastRouter:
+    """Keyword + embedding router in front of the LLM routing call"""
+
+    def __init__(self, agents: Dict[str, Any]):
+        # Shared with the orchestrator, so (un)registrations show up here
+        self.agents = agents
+
+        self._encoder: Optional[Callable] = None
+        self._encoder_failed = False
+
+        # Stacked (N, D) float32 unit vectors, one row per defaultable capability
+        self._capability_matrix: Optional[np.ndarray] = None
+        self._capability_keys: Tuple[Tuple[str, str], ...] = ()
+
+    def invalidate(self):
+        """Drop capability embeddings; rebuilt on the next embedding lookup"""
+        self._capability_matrix = None
+        self._capability_keys = ()
+
+    def route(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """Return a routing decision, or None if the LLM should decide"""
+        text = normalize_command(user_input)
+        if not text:
+            return None
+
+        matched, decision = self._match_keywords(text)
+        if matched:
+            return decision
+
+        if _PARAM_HINT_RE.search(text):
+            return None
+        return self._match_embedding(text)
+
+    def _match_keywords(self, text: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """(matched, decision); a match whose params don't validate gives (True, None)"""
+        matched = match_command(text)
+        if matched is None:
+            return False, None
+        name, params = matched
+        if params is None:
+            return True, None  # e.g. "start a timer" is not an app
+
+        route = KEYWORD_ROUTES.get(name)
+        if route is None or route[0] not in self.agents:
+            return False, None  # No agent for this command here
+        agent_name, action, param_names = route
+        action_params = {param_names[key]: params[key] for key in param_names}
+        return True, _single(agent_name, action, action_params, "keyword match")
+
+    def _match_embedding(self, text: str) -> Optional[Dict[str, Any]]:
+        matrix = self._get_capability_matrix()
+        if matrix is None or not len(matrix):
+            return None
+
+        query = self._encode([text])[0]
+        scores = matrix @ query  # One matrix-vector product for every capability
+        best = int(np.argmax(scores))
+        if scores[best] < MIN_EMBEDDING_SIMILARITY:
+            return None
+
+        agent_name, action = self._capability_keys[best]
+        return _single(agent_name, action, {}, f"embedding match ({scores[best]:.2f})")
+
+    def _get_capability_matrix(self) -> Optional[np.ndarray]:
+        if self._capability_matrix is None:
+            if self._get_encoder() is None:
+                return None
+
+            keys, descriptions = [], []
+            for agent_name, agent in sorted(self.agents.items()):
+                for cap in agent.get_capabilities():
+                    if (agent_name, cap.name) in DEFAULTABLE_ACTIONS:
+                        keys.append((agent_name, cap.name))
+                        descriptions.append(f"{cap.name.replace('_', ' ')}: {cap.description}")
+
+            self._capability_keys = tuple(keys)
+            self._capability_matrix = (
+                self._encode(descriptions) if descriptions
+                else np.empty((0, 0), dtype=np.float32)
+            )
+        return self._capability_matrix
+
+    def _encode(self, texts) -> np.ndarray:
+        vectors = self._encoder(texts, normalize_embeddings=True, convert_to_numpy=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _get_encoder(self) -> Optional[Callable]:
+        """Load the sentence-transformers model on first use (optional dependency)"""
+        if self._encoder is None and not self._encoder_failed:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._encoder = SentenceTransformer(EMBEDDING_MODEL).encode
+            except Exception as e:
+                self._encoder_failed = True
+                logger.warning(f"Embedding routing disabled ({e}); using keywords only")
+        return self._encoder
+
+
+def _single(agent_name: str, action: str, params: Dict[str, Any], reason: str) -> Dict[str, Any]:
+    return {
+        "type": "single",
+        "agents": [{
+            "name": agent_name,
+            "action": action,
+            "params": params,
+            "reason": reason
+        }]
+    }
@@ -2,10 +2,30 @@
 Finance Agent - Specialized agent for financial tracking and analysis
 """
 
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 from typing import Dict, Any, List
-from src.agents.base_agent import BaseAgent, AgentMessage, AgentCapability
-from src.modules.finance_manager_sql import FinanceManagerSQL
-import time
+from src.agents.base_agent import BaseAgent, AgentMessage, AgentCapability, TaskDict
+
+
+# Any of these substrings marks a task as finance-related; matched in a
+# single regex pass rather than one `in` scan per keyword
+_FINANCE_KEYWORDS = frozenset((
+    "expense", "spending", "budget", "money", "cost",
+    "price", "finance", "track", "analyze", "spent"
+))
+_FINANCE_RE = re.compile("|".join(map(re.escape, sorted(_FINANCE_KEYWORDS))))
+
+
+class FinanceAction(IntEnum):
+    """Integer action ids for in-process callers (names mirror the action strings)"""
+    TRACK_EXPENSE = 0
+    ANALYZE_SPENDING = 1
+    GET_BUDGET_STATUS = 2
+    GENERATE_REPORT = 3
+    ANALYZE_BATCH = 4
 
 
 class FinanceAgent(BaseAgent):
@@ -19,48 +39,74 @@ class FinanceAgent(BaseAgent):
     - Financial reporting
     """
     
+    # (name, description, parameters) for each capability this agent offers
+    CAPABILITIES = (
+        ("track_expense", "Log an expense transaction",
+         ("amount", "currency", "category", "description")),
+        ("analyze_spending", "Analyze spending patterns by category or timeframe",
+         ("category", "timeframe")),
+        ("get_budget_status", "Check budget status for a category",
+         ("category",)),
+        ("generate_report", "Generate financial report",
+         ("timeframe", "format")),
+        ("analyze_batch", "Analyze spending for several category/timeframe filters at once",
+         ("items",)),
+    )
+    
     def __init__(self):
         super().__init__(name="finance_agent", role="Financial Advisor")
         
-        # Initialize finance tools
-        self.finance_manager = FinanceManagerSQL()
+        # Finance manager is created lazily (see the finance_manager property);
+        # the lock keeps pool threads from each opening their own database
+        self._finance_manager = None
+        self._lazy_lock = threading.Lock()
+        
+        # Independent read-only queries (reports, batch analyses) fan out here;
+        # each worker reads through its own SQLite connection (FinanceManagerSQL._reader)
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="finance")
+        
+        # Action name -> handler, looked up once per message
+        self._handlers = {
+            "track_expense": self._track_expense,
+            "analyze_spending": self._analyze_spending,
+            "get_budget_status": self._get_budget_status,
+            "generate_report": self._generate_report,
+            "analyze_batch": self._analyze_batch,
+        }
+        self._action_table = tuple(self._handlers[action.name.lower()] for action in FinanceAction)
         
         # Register capabilities
         self._register_capabilities()
         
         self.logger.info("Finance Agent ready")
     
+    @property
+    def finance_manager(self):
+        """Finance database, opened on first use"""
+        if self._finance_manager is None:
+            with self._lazy_lock:
+                if self._finance_manager is None:
+                    from src.modules.finance_manager_sql import FinanceManagerSQL
+                    self._finance_manager = FinanceManagerSQL()
+        return self._finance_manager
+    
+    def close(self):
+        """Stop the query workers and close the finance database"""
+        # Wait for running queries (short, local) so the database isn't closed under them
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        if self._finance_manager is not None:
+            self._finance_manager.close()
+    
     def _register_capabilities(self):
         """Register all financial capabilities"""
-        self.register_capability(
-            name="track_expense",
-            description="Log an expense transaction",
-            parameters=["amount", "currency", "category", "description"]
-        )
-        
-        self.register_capability(
-            name="analyze_spending",
-            description="Analyze spending patterns by category or timeframe",
-            parameters=["category", "timeframe"]
-        )
-        
-        self.register_capability(
-            name="get_budget_status",
-            description="Check budget status for a category",
-            parameters=["category"]
-        )
-        
-        self.register_capability(
-            name="generate_report",
-            description="Generate financial report",
-            parameters=["timeframe", "format"]
-        )
+        for name, description, parameters in self.CAPABILITIES:
+            self.register_capability(name, description, list(parameters))
     
     def get_capabilities(self) -> List[AgentCapability]:
         """Return list of capabilities"""
         return self.capabilities
     
-    def can_handle(self, task: Dict[str, Any]) -> float:
+    def can_handle(self, task: TaskDict) -> float:
         """
         Determine if this agent can handle a task
         
@@ -69,17 +115,11 @@ class FinanceAgent(BaseAgent):
         action = task.get("action", "").lower()
         
         # High confidence for explicit finance actions
-        finance_keywords = [
-            "expense", "spending", "budget", "money", "cost", 
-            "price", "finance", "track", "analyze", "spent"
-        ]
-        
-        if any(keyword in action for keyword in finance_keywords):
+        if _FINANCE_RE.search(action):
             return 0.95
         
         # Check content for finance-related terms
-        content = str(task.get("content", "")).lower()
-        if any(keyword in content for keyword in finance_keywords):
+        if self._content_matches(task, _FINANCE_RE):
             return 0.75
         
         return 0.0
@@ -94,58 +134,15 @@ class FinanceAgent(BaseAgent):
         Returns:
             Response message with results
         """
-        start_time = time.time()
+        result, msg_type = self._run_action(message.content)
         
-        try:
-            content = message.content
-            action = content.get("action")
-            params = content.get("params", {})
-            
-            self.logger.info(f"Processing action: {action}")
-            
-            # Route to appropriate handler
-            if action == "track_expense":
-                result = self._track_expense(params)
-            elif action == "analyze_spending":
-                result = self._analyze_spending(params)
-            elif action == "get_budget_status":
-                result = self._get_budget_status(params)
-            elif action == "generate_report":
-                result = self._generate_report(params)
-            else:
-                result = {
-                    "success": False,
-                    "message": f"Unknown action: {action}"
-                }
-            
-            # Update metrics
-            response_time = time.time() - start_time
-            self.update_metrics(success=result.get("success", False), 
-                              response_time=response_time)
-            
-            # Create response message
-            response = self.send_message(
-                to_agent=message.from_agent,
-                content=result,
-                msg_type="response"
-            )
-            response.task_id = message.task_id
-            
-            return response
-            
-        except Exception as e:
-            self.logger.error(f"Error processing message: {e}")
-            response_time = time.time() - start_time
-            self.update_metrics(success=False, response_time=response_time)
-            
-            return self.send_message(
-                to_agent=message.from_agent,
-                content={
-                    "success": False,
-                    "message": f"Error: {str(e)}"
-                },
-                msg_type="error"
-            )
+        # Create response message
+        return self.send_message(
+            to_agent=message.from_agent,
+            content=result,
+            msg_type=msg_type,
+            task_id=message.task_id
+        )
     
     def _track_expense(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Track an expense"""
@@ -202,19 +199,41 @@ class FinanceAgent(BaseAgent):
         """Generate financial report"""
         try:
             timeframe = params.get("timeframe", "month")
-            # This would generate a comprehensive report
-            # For now, return a placeholder
+            finance_manager = self.finance_manager
+            
+            # Total and per-category breakdown are independent queries
+            summary_future = self._pool.submit(finance_manager.analyze_spending, timeframe=timeframe)
+            breakdown_future = self._pool.submit(finance_manager.get_category_breakdown, timeframe=timeframe)
+            summary = summary_future.result()
+            breakdown = breakdown_future.result()
+            
+            lines = [summary] + [
+                f"- {row['category']}: ${row['total']:.2f} ({row['count']} transactions)"
+                for row in breakdown
+            ]
             return {
                 "success": True,
-                "message": f"Financial report for {timeframe} not yet implemented",
-                "data": {}
+                "message": "\n".join(lines),
+                "data": {"summary": summary, "categories": breakdown}
             }
         except Exception as e:
             return {
                 "success": False,
                 "message": f"Failed to generate report: {str(e)}"
             }
-
+    
+    def _analyze_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run several spending analyses concurrently"""
+        items = params.get("items") or []
+        self.finance_manager  # Create it here so workers don't wait on the lazy lock
+        
+        futures = [self._pool.submit(self._analyze_spending, item) for item in items]
+        results = [future.result() for future in futures]
+        return {
+            "success": all(result.get("success", False) for result in results),
+            "message": "\n".join(str(result.get("message", "")) for result in results),
+            "data": results
+        }
 
 if __name__ == "__main__":
     # Test the Finance Agent
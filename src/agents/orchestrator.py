@@ -2,15 +2,74 @@
 Agent Orchestrator - Coordinates all specialized agents
 """
 
-from typing import Dict, Any, List, Optional
-from src.agents.base_agent import BaseAgent, AgentMessage
+from typing import AsyncIterator, Deque, Dict, Any, Iterator, List, Optional, Tuple
+from src.agents.base_agent import AgentRequest, BaseAgent
+from src.agents.batching_router import BatchingRouter
+from src.agents.fast_router import FastRouter
 from src.core.logger_config import get_logger
-from openai import OpenAI
-import json
+from src.utils import fast_json
+from src.utils.ttl_cache import TTLCache
+from openai import AsyncOpenAI
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import atexit
+import httpx
+import itertools
+import queue
+import threading
 import time
 
 logger = get_logger(__name__)
 
+# Upper bound on agents running at once for a multi-agent request
+MAX_PARALLEL_AGENTS = 4
+# Seconds to wait for one agent before reporting it as timed out
+AGENT_TIMEOUT = 30.0
+# Most recent routed tasks kept for status reporting
+TASK_HISTORY_LIMIT = 1000
+# Seconds to wait for a (possibly batched) routing decision
+ROUTING_TIMEOUT = 30.0
+
+# Static prompt prefixes come first so the server can reuse their KV cache;
+# only the trailing user message changes between requests
+ROUTING_PROMPT_TEMPLATE = """You are an orchestrator deciding which agent(s) should handle a user request.
+
+AVAILABLE AGENTS:
+{AGENTS}
+
+Decide which agent(s) to use and what action(s) to take.
+
+RESPONSE FORMAT (JSON only):
+{
+    "type": "single|multi|chat",
+    "agents": [
+        {
+            "name": "agent_name",
+            "action": "capability_name",
+            "params": {},
+            "reason": "why this agent"
+        }
+    ],
+    "strategy": "all|race",
+    "response_template": "How to respond to user"
+}
+
+If it's just conversation (no action needed), use type="chat".
+If multiple agents needed, use type="multi".
+For type="multi", use strategy="race" when the agents are alternative ways to
+get the same answer and the first successful one is enough; otherwise "all".
+"""
+
+SYNTHESIS_PROMPT = """Synthesize the agent responses below into a single, coherent response to the user.
+Be natural and conversational."""
+
+CHAT_PROMPT = """You are JARVIS, a helpful AI assistant.
+Respond naturally and helpfully.
+
+USER MEMORY:
+"""
+
 
 class AgentOrchestrator:
     """
@@ -27,17 +86,77 @@ class AgentOrchestrator:
         self.agents: Dict[str, BaseAgent] = {}
         self.memory_manager = memory_manager
         self.shared_context: Dict[str, Any] = {}
-        self.task_history: List[Dict[str, Any]] = []
+        self.task_history: Deque[Dict[str, Any]] = deque(maxlen=TASK_HISTORY_LIMIT)
+        self.total_tasks = 0
+        
+        # Every LLM call runs on this long-lived loop, so the async client's
+        # keep-alive connections to Ollama survive between requests
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="orchestrator-loop", daemon=True
+        )
+        self._loop_thread.start()
         
         # LLM for orchestration decisions
-        self.client = OpenAI(
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300.0)
+        )
+        self.client = AsyncOpenAI(
             base_url="http://localhost:11434/v1",
-            api_key="ollama"
+            api_key="ollama",
+            http_client=self.http_client
         )
         self.model = "llama3.2"
         
+        # Chat system prompt, rebuilt only when memory_manager.version changes
+        self._chat_prompt = CHAT_PROMPT
+        self._chat_prompt_version: Optional[int] = None
+        
+        # Obvious requests are routed without the LLM
+        self._fast_router = FastRouter(self.agents)
+        
+        # Routing decisions by normalized input; cleared when the roster changes
+        self._routing_cache = TTLCache(maxsize=512, ttl=3600.0)
+        self._routing_prompt = self._build_routing_prompt()
+        self._routing_formats = self._build_routing_formats()
+        # Static part of list_agents() per agent; metrics are read live
+        self._agent_summaries: List[tuple] = []
+        # Concurrent route_task calls share one LLM routing request
+        self._router = BatchingRouter(
+            lambda user_input: self._run_on_loop(self._request_routing(user_input)),
+            lambda user_inputs: self._run_on_loop(self._request_routings(user_inputs))
+        )
+        
+        # Agents are synchronous (subprocess, browser, SQL); multi-agent
+        # requests run them on these threads
+        self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent")
+        atexit.register(self.shutdown)
+        
         logger.info("Agent Orchestrator initialized")
     
+    def shutdown(self):
+        """Stop the router, agent workers, agents and event loop (pending agent calls are cancelled)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._router.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for agent in list(self.agents.values()):
+            try:
+                agent.close()
+            except Exception as e:
+                logger.warning(f"Error closing agent {agent.name}: {e}")
+        try:
+            self._run_on_loop(self.http_client.aclose(), timeout=1.0)
+        except Exception as e:
+            logger.warning(f"Error closing LLM client: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+    
+    def _run_on_loop(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the orchestrator loop from any other thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+    
     def register_agent(self, agent: BaseAgent):
         """
         Register a new agent with the orchestrator
@@ -46,16 +165,95 @@ class AgentOrchestrator:
             agent: Agent instance to register
         """
         self.agents[agent.name] = agent
+        self._roster_changed()
         logger.info(f"Registered agent: {agent.name} ({agent.role})")
         
         # Log capabilities
         for cap in agent.get_capabilities():
             logger.info(f"  - {cap.name}: {cap.description}")
     
+    def _roster_changed(self):
+        """Rebuild the routing prompt and agent summaries; drop decisions made for the old roster"""
+        self._routing_cache.clear()
+        self._fast_router.invalidate()
+        self._routing_prompt = self._build_routing_prompt()
+        self._routing_formats = self._build_routing_formats()
+        self._agent_summaries = [
+            (agent, {
+                "name": agent.name,
+                "role": agent.role,
+                "capabilities": agent.get_capabilities_dict()
+            })
+            for agent in self.agents.values()
+        ]
+    
+    def _build_routing_prompt(self) -> str:
+        """
+        Static part of the routing prompt: role, agents and response format
+        
+        Agents and capabilities are sorted so the text (and the server's
+        prompt-prefix cache) stays identical until the roster changes.
+        """
+        agent_descriptions = []
+        for agent in sorted(self.agents.values(), key=lambda a: a.name):
+            caps = ", ".join(sorted(cap.name for cap in agent.get_capabilities()))
+            agent_descriptions.append(
+                f"- {agent.name} ({agent.role}): {caps}"
+            )
+        
+        agents_text = "\n".join(agent_descriptions)
+        
+        return ROUTING_PROMPT_TEMPLATE.replace("{AGENTS}", agents_text)
+    
+    def _build_routing_formats(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        response_format values for single and batched routing calls
+        
+        The JSON schema lets Ollama constrain decoding, so the reply always
+        parses and only names registered agents and capabilities.
+        """
+        agent_schema: Dict[str, Any] = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "action": {"type": "string"},
+                "params": {"type": "object"},
+                "reason": {"type": "string"}
+            },
+            "required": ["name", "action", "params"]
+        }
+        if self.agents:
+            agent_schema["properties"]["name"]["enum"] = sorted(self.agents)
+            agent_schema["properties"]["action"]["enum"] = sorted({
+                cap.name for agent in self.agents.values() for cap in agent.get_capabilities()
+            })
+        
+        routing_schema = {
+            "type": "object",
+            "properties": {
+                "type": {"enum": ["single", "multi", "chat"]},
+                "agents": {"type": "array", "items": agent_schema},
+                "strategy": {"enum": ["all", "race"]},
+                "response_template": {"type": "string"}
+            },
+            "required": ["type", "agents"]
+        }
+        batch_schema = {
+            "type": "object",
+            "properties": {"decisions": {"type": "array", "items": routing_schema}},
+            "required": ["decisions"]
+        }
+        
+        return (
+            {"type": "json_schema", "json_schema": {"name": "routing", "schema": routing_schema}},
+            {"type": "json_schema", "json_schema": {"name": "routing_batch", "schema": batch_schema}}
+        )
+    
     def unregister_agent(self, agent_name: str):
         """Remove an agent from the orchestrator"""
         if agent_name in self.agents:
             del self.agents[agent_name]
+            self._roster_changed()
             logger.info(f"Unregistered agent: {agent_name}")
     
     def get_agent(self, agent_name: str) -> Optional[BaseAgent]:
@@ -65,13 +263,8 @@ class AgentOrchestrator:
     def list_agents(self) -> List[Dict[str, Any]]:
         """List all registered agents and their capabilities"""
         return [
-            {
-                "name": agent.name,
-                "role": agent.role,
-                "capabilities": [cap.to_dict() for cap in agent.get_capabilities()],
-                "metrics": agent.metrics
-            }
-            for agent in self.agents.values()
+            {**summary, "metrics": agent.get_metrics()}
+            for agent, summary in self._agent_summaries
         ]
     
     def route_task(self, user_input: str) -> Dict[str, Any]:
@@ -84,30 +277,32 @@ class AgentOrchestrator:
         Returns:
             Response from agent(s)
         """
+        return self._run_on_loop(self.route_task_async(user_input))
+    
+    async def route_task_async(self, user_input: str) -> Dict[str, Any]:
+        """
+        Async version of route_task; agents in a multi routing run concurrently
+        
+        Must run on the orchestrator loop (route_task schedules it there).
+        """
         start_time = time.time()
         
         try:
             # Step 1: Use LLM to understand intent and identify required agents
-            routing_decision = self._decide_routing(user_input)
+            routing_decision = await self._decide_routing(user_input)
             
             logger.info(f"Routing decision: {routing_decision}")
             
             # Step 2: Execute task with selected agent(s)
             if routing_decision["type"] == "single":
-                result = self._execute_single_agent(routing_decision, user_input)
+                result = await self._execute_single_agent(routing_decision, user_input)
             elif routing_decision["type"] == "multi":
-                result = self._execute_multi_agent(routing_decision, user_input)
+                result = await self._execute_multi_agent(routing_decision, user_input)
             else:
-                result = self._handle_chat(user_input)
+                result = await self._handle_chat(user_input)
             
             # Step 3: Record task
-            self.task_history.append({
-                "input": user_input,
-                "routing": routing_decision,
-                "result": result,
-                "duration": time.time() - start_time,
-                "timestamp": time.time()
-            })
+            self._record_task(user_input, routing_decision, result, start_time)
             
             return result
             
@@ -119,67 +314,154 @@ class AgentOrchestrator:
                 "error": str(e)
             }
     
-    def _decide_routing(self, user_input: str) -> Dict[str, Any]:
+    def route_task_stream(self, user_input: str) -> Iterator[str]:
+        """
+        Route user input and yield the response text as it is generated
+        
+        Chat replies and multi-agent syntheses arrive token by token; a
+        single-agent result arrives as one piece.
+        
+        Args:
+            user_input: User's natural language request
+            
+        Yields:
+            Response text fragments, in order
+        """
+        chunks = queue.SimpleQueue()
+        
+        async def pump():
+            try:
+                async for text in self.route_task_stream_async(user_input):
+                    chunks.put(text)
+            finally:
+                chunks.put(None)
+        
+        future = asyncio.run_coroutine_threadsafe(pump(), self._loop)
+        try:
+            while (text := chunks.get()) is not None:
+                yield text
+            future.result()
+        finally:
+            # Caller stopped reading early: stop generating
+            future.cancel()
+    
+    async def route_task_stream_async(self, user_input: str) -> AsyncIterator[str]:
+        """Async version of route_task_stream; must run on the orchestrator loop"""
+        start_time = time.time()
+        parts: List[str] = []
+        
+        try:
+            routing_decision = await self._decide_routing(user_input)
+            
+            logger.info(f"Routing decision: {routing_decision}")
+            
+            if routing_decision["type"] == "single":
+                result = await self._execute_single_agent(routing_decision, user_input)
+                parts.append(result["response"])
+                yield result["response"]
+            else:
+                if routing_decision["type"] == "multi":
+                    results = await self._run_agents(routing_decision, user_input)
+                    stream = self._stream_synthesis(results, user_input)
+                    result = {
+                        "success": True,
+                        "agents": [r["agent"] for r in results],
+                        "individual_results": results
+                    }
+                else:
+                    stream = self._stream_completion(self._chat_messages(user_input), temperature=0.7)
+                    result = {"success": True, "type": "chat"}
+                
+                async for text in stream:
+                    parts.append(text)
+                    yield text
+                result["response"] = "".join(parts)
+            
+            self._record_task(user_input, routing_decision, result, start_time)
+            
+        except Exception as e:
+            logger.error(f"Error routing task: {e}")
+            if not parts:
+                yield "I encountered an error processing your request."
+    
+    def _record_task(self, user_input: str, routing: Dict[str, Any],
+                     result: Dict[str, Any], start_time: float):
+        """Append a finished task to the history"""
+        self.total_tasks += 1
+        self.task_history.append({
+            "input": user_input,
+            "routing": routing,
+            "result": result,
+            "duration": time.time() - start_time,
+            "timestamp": time.time()
+        })
+    
+    async def _decide_routing(self, user_input: str) -> Dict[str, Any]:
         """
         Use LLM to decide which agent(s) should handle the task
         
         Returns:
             Routing decision with agent names and actions
         """
-        # Build agent capabilities description
-        agent_descriptions = []
-        for agent in self.agents.values():
-            caps = ", ".join([cap.name for cap in agent.get_capabilities()])
-            agent_descriptions.append(
-                f"- {agent.name} ({agent.role}): {caps}"
-            )
-        
-        agents_text = "\n".join(agent_descriptions)
+        routing = self._fast_router.route(user_input)
+        if routing is not None:
+            return routing
         
-        prompt = f"""
-You are an orchestrator deciding which agent(s) should handle a user request.
-
-AVAILABLE AGENTS:
-{agents_text}
-
-USER REQUEST: "{user_input}"
-
-Decide which agent(s) to use and what action(s) to take.
-
-RESPONSE FORMAT (JSON only):
-{{
-    "type": "single|multi|chat",
-    "agents": [
-        {{
-            "name": "agent_name",
-            "action": "capability_name",
-            "params": {{}},
-            "reason": "why this agent"
-        }}
-    ],
-    "response_template": "How to respond to user"
-}}
-
-If it's just conversation (no action needed), use type="chat".
-If multiple agents needed, use type="multi".
-"""
+        # Repeated phrasings skip the LLM round trip
+        cache_key = " ".join(user_input.lower().split())
+        cached = self._routing_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.1
+            routing = await asyncio.wait_for(
+                asyncio.wrap_future(self._router.submit(user_input)),
+                timeout=ROUTING_TIMEOUT
             )
-            
-            response = completion.choices[0].message.content
-            return json.loads(response)
+            self._routing_cache.set(cache_key, routing)
+            return routing
             
         except Exception as e:
             logger.error(f"Error in routing decision: {e}")
             return {"type": "chat", "agents": []}
     
-    def _execute_single_agent(self, routing: Dict[str, Any], user_input: str) -> Dict[str, Any]:
+    async def _request_routing(self, user_input: str) -> Dict[str, Any]:
+        """Ask the LLM to route a single request"""
+        completion = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": self._routing_prompt},
+                {"role": "user", "content": f'USER REQUEST: "{user_input}"'}
+            ],
+            response_format=self._routing_formats[0],
+            temperature=0.1
+        )
+        
+        return fast_json.loads(completion.choices[0].message.content)
+    
+    async def _request_routings(self, user_inputs: List[str]) -> List[Dict[str, Any]]:
+        """Ask the LLM to route several requests at once, in order"""
+        requests_text = "\n".join(
+            f'{i}. "{user_input}"' for i, user_input in enumerate(user_inputs, 1)
+        )
+        
+        completion = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": self._routing_prompt},
+                {"role": "user", "content": (
+                    f"USER REQUESTS:\n{requests_text}\n\n"
+                    f'Return a JSON object {{"decisions": [...]}} holding one routing '
+                    f"decision per request, in the same order ({len(user_inputs)} total)."
+                )}
+            ],
+            response_format=self._routing_formats[1],
+            temperature=0.1
+        )
+        
+        return fast_json.loads(completion.choices[0].message.content)["decisions"]
+    
+    async def _execute_single_agent(self, routing: Dict[str, Any], user_input: str) -> Dict[str, Any]:
         """Execute task with a single agent"""
         if not routing.get("agents"):
             return {"success": False, "response": "No agent selected"}
@@ -191,68 +473,92 @@ If multiple agents needed, use type="multi".
         if not agent:
             return {"success": False, "response": f"Agent {agent_name} not found"}
         
-        # Create message for agent
-        message = AgentMessage(
-            from_agent="orchestrator",
-            to_agent=agent_name,
-            content={
-                "action": agent_info["action"],
-                "params": agent_info.get("params", {}),
-                "context": user_input
-            }
-        )
-        
-        # Send to agent and get response
-        response = agent.process_message(message)
+        # In-process call: no need to wrap the request/response in AgentMessages.
+        # Agents block (DB, subprocesses), so keep them off the event loop.
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._pool, agent.process_raw, AgentRequest(
+            agent_info["action"], agent_info.get("params"), user_input
+        ))
         
         return {
-            "success": response.content.get("success", False),
-            "response": response.content.get("message", ""),
-            "data": response.content.get("data"),
+            "success": result.get("success", False),
+            "response": result.get("message", ""),
+            "data": result.get("data"),
             "agent": agent_name
         }
     
-    def _execute_multi_agent(self, routing: Dict[str, Any], user_input: str) -> Dict[str, Any]:
-        """Execute task with multiple agents (sequential for now)"""
-        results = []
+    async def _execute_multi_agent(self, routing: Dict[str, Any], user_input: str) -> Dict[str, Any]:
+        """Execute task with multiple agents concurrently"""
+        results = await self._run_agents(routing, user_input)
+        
+        # Synthesize results
+        synthesized = await self._synthesize_responses(results, user_input)
+        
+        return {
+            "success": True,
+            "response": synthesized,
+            "agents": [r["agent"] for r in results],
+            "individual_results": results
+        }
+    
+    async def _run_agents(self, routing: Dict[str, Any], user_input: str) -> List[Dict[str, Any]]:
+        """Run every agent in a multi routing concurrently; results keep routing order"""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_AGENTS)
         
-        for agent_info in routing.get("agents", []):
+        async def run_one(agent_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
             agent_name = agent_info["name"]
             agent = self.get_agent(agent_name)
             
             if not agent:
                 logger.warning(f"Agent {agent_name} not found, skipping")
-                continue
+                return None
             
-            # Create message
-            message = AgentMessage(
-                from_agent="orchestrator",
-                to_agent=agent_name,
-                content={
-                    "action": agent_info["action"],
-                    "params": agent_info.get("params", {}),
-                    "context": user_input
-                }
-            )
+            content = AgentRequest(agent_info["action"], agent_info.get("params"), user_input)
             
-            # Execute
-            response = agent.process_message(message)
-            results.append({
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(
+                        loop.run_in_executor(self._pool, agent.process_raw, content),
+                        timeout=AGENT_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(f"Agent {agent_name} timed out after {AGENT_TIMEOUT:.0f}s")
+                    result = {"success": False, "message": f"{agent_name} timed out"}
+                except Exception as e:
+                    logger.error(f"Agent {agent_name} failed: {e}")
+                    result = {"success": False, "message": f"Error: {str(e)}"}
+            
+            return {
                 "agent": agent_name,
-                "result": response.content
-            })
+                "result": result
+            }
         
-        # Synthesize results
-        synthesized = self._synthesize_responses(results, user_input)
+        agent_infos = routing.get("agents", [])
         
-        return {
-            "success": True,
-            "response": synthesized,
-            "agents": [r["agent"] for r in results],
-            "individual_results": results
-        }
+        if routing.get("strategy") == "race":
+            # First successful agent wins; the rest stop being awaited (their
+            # worker threads finish in the background, results discarded)
+            tasks = [asyncio.ensure_future(run_one(info)) for info in agent_infos]
+            results = []
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    outcome = await next_done
+                    if outcome is None:
+                        continue
+                    if outcome["result"].get("success"):
+                        return [outcome]
+                    results.append(outcome)
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return results
+        
+        # gather keeps the routing order, so synthesis sees results as before
+        outcomes = await asyncio.gather(*(run_one(info) for info in agent_infos))
+        return [outcome for outcome in outcomes if outcome is not None]
     
-    def _synthesize_responses(self, results: List[Dict[str, Any]], user_input: str) -> str:
+    async def _synthesize_responses(self, results: List[Dict[str, Any]], user_input: str) -> str:
         """Combine multiple agent responses into coherent answer"""
         if not results:
             return "No results from agents"
@@ -261,53 +567,84 @@ If multiple agents needed, use type="multi".
             return results[0]["result"].get("message", "")
         
         # Use LLM to synthesize multiple responses
+        try:
+            completion = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._synthesis_messages(results, user_input),
+                temperature=0.3
+            )
+            return completion.choices[0].message.content
+        except Exception:  # Not CancelledError: cancelled requests must stay cancelled
+            # Fallback: just concatenate
+            return " ".join([r["result"].get("message", "") for r in results])
+    
+    async def _stream_synthesis(self, results: List[Dict[str, Any]], user_input: str) -> AsyncIterator[str]:
+        """Streaming version of _synthesize_responses"""
+        if len(results) < 2:
+            yield await self._synthesize_responses(results, user_input)
+            return
+        
+        streamed = False
+        try:
+            async for text in self._stream_completion(self._synthesis_messages(results, user_input), temperature=0.3):
+                streamed = True
+                yield text
+        except Exception as e:
+            if streamed:
+                raise
+            logger.error(f"Synthesis error: {e}")
+            # Fallback: just concatenate
+            yield " ".join([r["result"].get("message", "") for r in results])
+    
+    def _synthesis_messages(self, results: List[Dict[str, Any]], user_input: str) -> List[Dict[str, str]]:
         results_text = "\n".join([
             f"- {r['agent']}: {r['result'].get('message', '')}"
             for r in results
         ])
         
-        prompt = f"""
-User asked: "{user_input}"
+        prompt = f"""User asked: "{user_input}"
 
 Agent responses:
 {results_text}
-
-Synthesize these into a single, coherent response to the user.
-Be natural and conversational.
 """
-        
-        try:
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3
-            )
-            return completion.choices[0].message.content
-        except:
-            # Fallback: just concatenate
-            return " ".join([r["result"].get("message", "") for r in results])
+        return [
+            {"role": "system", "content": SYNTHESIS_PROMPT},
+            {"role": "user", "content": prompt},
+        ]
+    
+    async def _stream_completion(self, messages: List[Dict[str, str]], temperature: float) -> AsyncIterator[str]:
+        """Yield the LLM reply's text deltas as they arrive"""
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            stream=True
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    def _get_chat_prompt(self) -> str:
+        """Chat system prompt with the user's memories, reused until they change"""
+        if self.memory_manager and self._chat_prompt_version != self.memory_manager.version:
+            self._chat_prompt = CHAT_PROMPT + self.memory_manager.get_memory_string()
+            self._chat_prompt_version = self.memory_manager.version
+        return self._chat_prompt
+    
+    def _chat_messages(self, user_input: str) -> List[Dict[str, str]]:
+        # Memories change rarely, so they extend the static prefix
+        return [
+            {"role": "system", "content": self._get_chat_prompt()},
+            {"role": "user", "content": user_input},
+        ]
     
-    def _handle_chat(self, user_input: str) -> Dict[str, Any]:
+    async def _handle_chat(self, user_input: str) -> Dict[str, Any]:
         """Handle general conversation (no agent needed)"""
         # Use LLM for chat response
         try:
-            memories = ""
-            if self.memory_manager:
-                memories = self.memory_manager.get_memory_string()
-            
-            prompt = f"""
-You are JARVIS, a helpful AI assistant.
-
-USER MEMORY:
-{memories}
-
-USER: {user_input}
-
-Respond naturally and helpfully.
-"""
-            completion = self.client.chat.completions.create(
+            completion = await self.client.chat.completions.create(
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+                messages=self._chat_messages(user_input),
                 temperature=0.7
             )
             
@@ -330,8 +667,8 @@ Respond naturally and helpfully.
         return {
             "agents": self.list_agents(),
             "shared_context": self.shared_context,
-            "total_tasks": len(self.task_history),
-            "recent_tasks": self.task_history[-5:] if self.task_history else []
+            "total_tasks": self.total_tasks,
+            "recent_tasks": list(itertools.islice(reversed(self.task_history), 5))[::-1]
         }
 
 
@@ -3,10 +3,24 @@ System Agent - Specialized agent for system control and automation
 """
 
 from typing import Dict, Any, List
-from src.agents.base_agent import BaseAgent, AgentMessage, AgentCapability
-import subprocess
+from src.agents.base_agent import BaseAgent, AgentMessage, AgentCapability, TaskDict
+from src.utils.apps_config import (
+    find_application_path, get_app_from_alias, launch_application, preload_application_paths
+)
+from src.utils.launch_worker import LaunchWorker
+import os
+import re
 import webbrowser
-import time
+
+from src.utils.desktop import pyautogui  # None when unavailable
+
+# Any of these substrings marks a task as a system operation; matched in a
+# single case-insensitive regex pass rather than one `in` scan per keyword
+_SYSTEM_KEYWORDS = frozenset((
+    "open", "close", "launch", "start", "stop",
+    "volume", "screenshot", "search", "browse"
+))
+_SYSTEM_RE = re.compile("|".join(map(re.escape, sorted(_SYSTEM_KEYWORDS))), re.IGNORECASE)
 
 
 class SystemAgent(BaseAgent):
@@ -25,6 +39,19 @@ class SystemAgent(BaseAgent):
         
         # Track running processes
         self.running_processes = {}
+        preload_application_paths()
+        
+        # Apps and browser tabs are spawned by a small helper process rather
+        # than forked from this (large) one; started on first use
+        self._worker = LaunchWorker() if os.name == "posix" else None
+        
+        # Action name -> handler, looked up once per message
+        self._handlers = {
+            "open_application": self._open_application,
+            "close_application": self._close_application,
+            "search_web": self._search_web,
+            "system_control": self._system_control,
+        }
         
         # Register capabilities
         self._register_capabilities()
@@ -61,26 +88,20 @@ class SystemAgent(BaseAgent):
         """Return list of capabilities"""
         return self.capabilities
     
-    def can_handle(self, task: Dict[str, Any]) -> float:
+    def can_handle(self, task: TaskDict) -> float:
         """
         Determine if this agent can handle a task
         
         Returns confidence score (0.0 to 1.0)
         """
-        action = task.get("action", "").lower()
+        action = task.get("action", "")
         
         # High confidence for explicit system actions
-        system_keywords = [
-            "open", "close", "launch", "start", "stop",
-            "volume", "screenshot", "search", "browse"
-        ]
-        
-        if any(keyword in action for keyword in system_keywords):
+        if _SYSTEM_RE.search(action):
             return 0.95
         
         # Check content
-        content = str(task.get("content", "")).lower()
-        if any(keyword in content for keyword in system_keywords):
+        if self._content_matches(task, _SYSTEM_RE):
             return 0.75
         
         return 0.0
@@ -95,67 +116,30 @@ class SystemAgent(BaseAgent):
         Returns:
             Response message with results
         """
-        start_time = time.time()
+        result, msg_type = self._run_action(message.content)
         
-        try:
-            content = message.content
-            action = content.get("action")
-            params = content.get("params", {})
-            
-            self.logger.info(f"Processing action: {action}")
-            
-            # Route to appropriate handler
-            if action == "open_application":
-                result = self._open_application(params)
-            elif action == "close_application":
-                result = self._close_application(params)
-            elif action == "search_web":
-                result = self._search_web(params)
-            elif action == "system_control":
-                result = self._system_control(params)
-            else:
-                result = {
-                    "success": False,
-                    "message": f"Unknown action: {action}"
-                }
-            
-            # Update metrics
-            response_time = time.time() - start_time
-            self.update_metrics(success=result.get("success", False), 
-                              response_time=response_time)
-            
-            # Create response message
-            response = self.send_message(
-                to_agent=message.from_agent,
-                content=result,
-                msg_type="response"
-            )
-            response.task_id = message.task_id
-            
-            return response
-            
-        except Exception as e:
-            self.logger.error(f"Error processing message: {e}")
-            response_time = time.time() - start_time
-            self.update_metrics(success=False, response_time=response_time)
-            
-            return self.send_message(
-                to_agent=message.from_agent,
-                content={
-                    "success": False,
-                    "message": f"Error: {str(e)}"
-                },
-                msg_type="error"
-            )
+        # Create response message
+        return self.send_message(
+            to_agent=message.from_agent,
+            content=result,
+            msg_type=msg_type,
+            task_id=message.task_id
+        )
     
     def _open_application(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Open an application"""
         try:
-            from src.utils.apps_config import find_application_path
-            
             app_name = params.get("app_name")
             if not app_name:
                 return {"success": False, "message": "No app name provided"}
+            app_name = get_app_from_alias(app_name) or app_name
+            
+            proc = self.running_processes.get(app_name)
+            if proc is not None and proc.poll() is None:
+                return {
+                    "success": True,
+                    "message": f"{app_name} is already running"
+                }
             
             path = find_application_path(app_name)
             if not path:
@@ -165,7 +149,7 @@ class SystemAgent(BaseAgent):
                 }
             
             # Start the process
-            proc = subprocess.Popen(path)
+            proc = self._worker.launch(path) if self._worker else launch_application(path)
             self.running_processes[app_name] = proc
             
             return {
@@ -182,6 +166,8 @@ class SystemAgent(BaseAgent):
     def _close_application(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Close an application"""
         app_name = params.get("app_name")
+        if app_name:
+            app_name = get_app_from_alias(app_name) or app_name
         
         if app_name in self.running_processes:
             try:
@@ -210,7 +196,10 @@ class SystemAgent(BaseAgent):
                 return {"success": False, "message": "No search query provided"}
             
             url = f"https://www.google.com/search?q={query}"
-            webbrowser.open(url)
+            if self._worker:
+                self._worker.open_url(url)
+            else:
+                webbrowser.open(url)
             
             return {
                 "success": True,
@@ -225,9 +214,13 @@ class SystemAgent(BaseAgent):
     
     def _system_control(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute system control commands"""
+        if pyautogui is None:
+            return {
+                "success": False,
+                "message": "System control failed: pyautogui is not available"
+            }
+        
         try:
-            import pyautogui
-            
             command = params.get("command")
             if not command:
                 return {"success": False, "message": "No command provided"}
@@ -7,28 +7,129 @@ Command executor - Execute system commands based on intents
 
 import subprocess
 import os
-import psutil
-import time
-from src.utils.apps_config import find_application_path, APPLICATIONS
+import select
+import threading
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from src.utils.apps_config import find_application_path, launch_application, preload_application_paths
 from src.modules.finance_manager_sql import FinanceManagerSQL as FinanceManager  # UPGRADED: SQLite instead of CSV
 from src.modules.reminder_manager import ReminderManager
 from datetime import datetime, timedelta
 import re
-from src.modules.memory_manager import MemoryManager
-from src.modules.tools_manager import ToolsManager  # IMPORT TOOLS
-from src.modules.vision_manager import VisionManager # IMPORT VISION
-from src.modules.knowledge_manager import KnowledgeManager # IMPORT KNOWLEDGE
+# Tools, vision and knowledge managers are imported on first use (see properties below):
+# chromadb + sentence-transformers and duckduckgo_search dominate startup time
+
+from src.utils.desktop import pyautogui  # None when unavailable
+
+# Reminder time shapes understood by CommandExecutor._parse_time
+_ABSOLUTE_TIME_RE = re.compile(
+    r'(\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}:\d{2})\s*([AP]M)?', re.IGNORECASE
+)
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_RELATIVE_TIME_RE = re.compile(r'in (\d+) (minute|hour|day)s?', re.IGNORECASE)
+
+# Seconds smart_search waits for the web search once the knowledge base missed
+WEB_SEARCH_TIMEOUT = 15.0
+
+# Head start (seconds) the knowledge base gets before smart_search also starts
+# the web search: a fast local hit never reaches the search provider, while a
+# slow one overlaps with the web request instead of delaying it
+KB_HEAD_START = 0.3
+
+# System command -> media key pressed via pyautogui
+SYSTEM_KEYS = {
+    "volume_up": "volumeup",
+    "volume_down": "volumedown",
+    "mute": "volumemute",
+}
+
+def _wait_process(proc, timeout):
+    """
+    Wait up to `timeout` seconds for a Popen process to exit.
+    
+    On Linux this sleeps on a pidfd until the kernel reports the exit,
+    instead of Popen.wait()'s waitpid(WNOHANG) + sleep polling loop.
+    Returns the exit code, or None if the process is still running.
+    """
+    try:
+        fd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        # No pidfd support (non-Linux, old kernel or Python < 3.9)
+        try:
+            return proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return None
+    
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        poller.poll(timeout * 1000)
+    finally:
+        os.close(fd)
+    return proc.poll()
 
 class CommandExecutor:
     def __init__(self, memory_manager):
         """Initialize command executor"""
         self.running_processes = {}
+        preload_application_paths()
         self.finance = FinanceManager()
         self.memory = memory_manager
-        self.tools = ToolsManager() # INIT TOOLS
         self.reminders = ReminderManager()  # INIT REMINDERS
-        self.vision = VisionManager() # INIT VISION
-        self.knowledge = KnowledgeManager() # INIT KNOWLEDGE
+        self._tools = None
+        self._vision = None
+        self._knowledge = None
+        # Guards creation of the lazy managers above (search runs on its own thread)
+        self._lazy_lock = threading.Lock()
+        # smart_search runs the knowledge-base and web searches here, overlapped
+        self._search_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search")
+        
+        # Action -> handler dispatch table, built once
+        self._handlers = {
+            "open": self._handle_open,
+            "close": self._handle_close,
+            "search": self._handle_search,
+            "system": self._handle_system,
+            "ask_finance": self._handle_ask_finance,
+            "track_expense": self._handle_track_expense,
+            "remember": self._handle_remember,
+            "weather": self._handle_weather,
+            "smart_search": self._handle_smart_search,
+            "analyze_screen": self._handle_analyze_screen,
+            "set_reminder": self._handle_set_reminder,
+            "set_timer": self._handle_set_timer,
+            "list_reminders": self._handle_list_reminders,
+        }
+    
+    @property
+    def tools(self):
+        """Web/weather tools, created on first use"""
+        if self._tools is None:
+            with self._lazy_lock:
+                if self._tools is None:
+                    from src.modules.tools_manager import ToolsManager
+                    self._tools = ToolsManager()
+        return self._tools
+    
+    @property
+    def vision(self):
+        """Screen analysis, created on first use"""
+        if self._vision is None:
+            with self._lazy_lock:
+                if self._vision is None:
+                    from src.modules.vision_manager import VisionManager
+                    self._vision = VisionManager()
+        return self._vision
+    
+    @property
+    def knowledge(self):
+        """Local knowledge base (RAG), created on first use"""
+        if self._knowledge is None:
+            with self._lazy_lock:
+                if self._knowledge is None:
+                    from src.modules.knowledge_manager import KnowledgeManager
+                    self._knowledge = KnowledgeManager()
+        return self._knowledge
     
     def execute(self, intent):
         """
@@ -40,108 +141,127 @@ class CommandExecutor:
                 "message": "Could not understand command"
             }
         
-        action = intent.get("action")
-        target = intent.get("target")
-        query = intent.get("query")
-        
         # Route to appropriate handler
-        if action == "open":
-            return self._open_application(target, query)
-        elif action == "close":
-            return self._close_application(target)
-        elif action == "search":
-            return self._search_web(query)
-        elif action == "system":
-            return self._control_system(target)
-            
-        # NEW: Finance Handler - Analysis
-        elif action == "ask_finance":
-            return {
-                "success": True,
-                "message": self.finance.analyze_spending(
-                    category=intent.get("category"),
-                    timeframe=intent.get("timeframe", "all")
-                )
-            }
-            
-        # NEW: Finance Handler
-        elif action == "track_expense":
-            return self.finance.log_transaction(
-                amount=intent.get("amount"),
-                currency=intent.get("currency", "$"),
+        return self._handlers.get(intent.get("action"), self._handle_chat)(intent)
+    
+    def _handle_open(self, intent):
+        return self._open_application(intent.get("target"), intent.get("query"))
+    
+    def _handle_close(self, intent):
+        return self._close_application(intent.get("target"))
+    
+    def _handle_search(self, intent):
+        return self._search_web(intent.get("query"))
+    
+    def _handle_system(self, intent):
+        return self._control_system(intent.get("target"))
+    
+    def _handle_ask_finance(self, intent):
+        """Finance Handler - Analysis"""
+        return {
+            "success": True,
+            "message": self.finance.analyze_spending(
                 category=intent.get("category"),
-                description=intent.get("description")
+                timeframe=intent.get("timeframe", "all")
             )
-            
-        # NEW: Memory Handler
-        elif action == "remember":
-            fact = intent.get("fact")
-            if fact:
-                self.memory.add_memory(fact)
-                return {"success": True, "message": f"I'll remember that: {fact}"}
-            return {"success": False, "message": "No fact provided to remember"}
-            
-        # NEW: Weather Handler
-        elif action == "weather":
-            city = intent.get("target", "Singapore") # Default to Singapore if no target
-            return {"success": True, "message": self.tools.get_weather(city)}
-            
-        # NEW: Smart Search Handler (Updated with RAG)
-        elif action == "smart_search":
-            # 1. Check Knowledge Base first
-            kb_results = self.knowledge.query(query)
-            if kb_results:
-                # Found something in local files
-                context = "\n\n".join([f"Source: {r['source']}\n{r['content']}" for r in kb_results])
-                return {
-                    "success": True, 
-                    "message": f"Found in Knowledge Base:\n{context}\n\n(I also searched the web if needed, but local data takes priority.)"
-                }
-            
-            # 2. Fallback to Web Search
-            return {"success": True, "message": self.tools.search_web(query)}
-            
-        # NEW: Vision Handler
-        elif action == "analyze_screen":
-            query = intent.get("query", "Describe what is on my screen")
-            return {"success": True, "message": self.vision.analyze_screen(query)}
-            
-        # Reminder Handler
-        elif action == "set_reminder":
-            text = intent.get("text") or intent.get("query")
-            time_str = intent.get("time")
-            recurring = intent.get("recurring")
-            
-            if not text or not time_str:
-                return {"success": False, "message": "Need reminder text and time"}
-            
-            try:
-                reminder_time = self._parse_time(time_str)
-                result = self.reminders.add_reminder(text, reminder_time, recurring)
-                return result
-            except Exception as e:
-                return {"success": False, "message": f"Error: {e}"}
-        
-        # Timer Handler
-        elif action == "set_timer":
-            duration = intent.get("duration_minutes")
-            label = intent.get("label", "Timer")
-            
-            if not duration:
-                return {"success": False, "message": "Need timer duration"}
-            
-            return self.reminders.add_timer(duration, label)
+        }
+    
+    def _handle_track_expense(self, intent):
+        """Finance Handler"""
+        return self.finance.log_transaction(
+            amount=intent.get("amount"),
+            currency=intent.get("currency", "$"),
+            category=intent.get("category"),
+            description=intent.get("description")
+        )
+    
+    def _handle_remember(self, intent):
+        """Memory Handler"""
+        fact = intent.get("fact")
+        if fact:
+            self.memory.add_memory(fact)
+            return {"success": True, "message": f"I'll remember that: {fact}"}
+        return {"success": False, "message": "No fact provided to remember"}
+    
+    def _handle_weather(self, intent):
+        """Weather Handler"""
+        city = intent.get("target", "Singapore") # Default to Singapore if no target
+        return {"success": True, "message": self.tools.get_weather(city)}
+    
+    def _handle_smart_search(self, intent):
+        """Smart Search Handler (with RAG)"""
+        query = intent.get("query")
         
-        # List Reminders Handler
-        elif action == "list_reminders":
-            reminders_list = self.reminders.list_reminders()
-            return {"success": True, "message": reminders_list}
+        # 1. Check Knowledge Base first, alone for KB_HEAD_START seconds
+        kb_future = self._search_pool.submit(self.knowledge.query, query)
+        web_future = None
+        try:
+            kb_results = kb_future.result(timeout=KB_HEAD_START)
+        except FutureTimeoutError:
+            # Slow knowledge base: start the web search alongside it
+            web_future = self._search_pool.submit(lambda: self.tools.search_web(query))
+            kb_results = kb_future.result()
         
-        else:
+        if kb_results:
+            # Found something in local files; a web search still queued is
+            # cancelled, one already running is ignored
+            if web_future is not None:
+                web_future.cancel()
+            context = "\n\n".join([f"Source: {r['source']}\n{r['content']}" for r in kb_results])
             return {
-                "success": True, # It was likely just chat
-                "message": "Conversation processed"
+                "success": True, 
+                "message": f"Found in Knowledge Base:\n{context}\n\n(Answered from your local files, which take priority over the web.)"
             }
+        
+        # 2. Fallback to Web Search
+        if web_future is None:
+            web_future = self._search_pool.submit(lambda: self.tools.search_web(query))
+        try:
+            return {"success": True, "message": web_future.result(timeout=WEB_SEARCH_TIMEOUT)}
+        except FutureTimeoutError:
+            return {"success": False, "message": "The web search took too long, please try again"}
+    
+    def _handle_analyze_screen(self, intent):
+        """Vision Handler"""
+        query = intent.get("query", "Describe what is on my screen")
+        return {"success": True, "message": self.vision.analyze_screen(query)}
+    
+    def _handle_set_reminder(self, intent):
+        """Reminder Handler"""
+        text = intent.get("text") or intent.get("query")
+        time_str = intent.get("time")
+        recurring = intent.get("recurring")
+        
+        if not text or not time_str:
+            return {"success": False, "message": "Need reminder text and time"}
+        
+        try:
+            reminder_time = self._parse_time(time_str)
+            result = self.reminders.add_reminder(text, reminder_time, recurring)
+            return result
+        except Exception as e:
+            return {"success": False, "message": f"Error: {e}"}
+    
+    def _handle_set_timer(self, intent):
+        """Timer Handler"""
+        duration = intent.get("duration_minutes")
+        label = intent.get("label", "Timer")
+        
+        if not duration:
+            return {"success": False, "message": "Need timer duration"}
+        
+        return self.reminders.add_timer(duration, label)
+    
+    def _handle_list_reminders(self, intent):
+        """List Reminders Handler"""
+        reminders_list = self.reminders.list_reminders()
+        return {"success": True, "message": reminders_list}
+    
+    def _handle_chat(self, intent):
+        return {
+            "success": True, # It was likely just chat
+            "message": "Conversation processed"
+        }
     
     def _open_application(self, app_name, query=None):
         """Open an application"""
@@ -151,36 +271,51 @@ class CommandExecutor:
         if not path:
             return {"success": False, "message": f"Could not find path for {app_name}"}
             
+        # Forget handles of apps that have exited since we launched them
+        for name, proc in list(self.running_processes.items()):
+            if proc.poll() is not None:
+                del self.running_processes[name]
+        
+        if app_name in self.running_processes:
+            return {"success": True, "message": f"{app_name} is already running"}
+            
         try:
             # Start the process
-            proc = subprocess.Popen(path)
+            proc = launch_application(path)
             self.running_processes[app_name] = proc
             return {"success": True, "message": f"Opened {app_name}"}
         except Exception as e:
             return {"success": False, "message": f"Failed to open {app_name}: {e}"}
 
     def _close_application(self, app_name):
-        """Close an application"""
-        # Simple kill implementation for demo
-        return {"success": False, "message": "Close function requires os specific implementation"}
+        """Close an application we previously opened"""
+        proc = self.running_processes.pop(app_name, None)
+        if proc is None or proc.poll() is not None:
+            return {"success": False, "message": f"{app_name} is not running or was not opened by me"}
+        
+        try:
+            proc.terminate()
+            if _wait_process(proc, timeout=3) is None:
+                proc.kill()
+                _wait_process(proc, timeout=1)
+            return {"success": True, "message": f"Closed {app_name}"}
+        except Exception as e:
+            return {"success": False, "message": f"Failed to close {app_name}: {e}"}
 
     def _search_web(self, query):
         """Open browser with search"""
-        import webbrowser
         url = f"https://www.google.com/search?q={query}"
         webbrowser.open(url)
         return {"success": True, "message": f"Searched for {query}"}
 
     def _control_system(self, command):
         """Basic system controls"""
+        if pyautogui is None:
+            return {"success": False, "message": "System control failed: pyautogui is not available"}
+        
         try:
-            import pyautogui
-            if command == "volume_up":
-                pyautogui.press("volumeup")
-            elif command == "volume_down":
-                pyautogui.press("volumedown")
-            elif command == "mute":
-                pyautogui.press("volumemute")
+            if command in SYSTEM_KEYS:
+                pyautogui.press(SYSTEM_KEYS[command])
             elif command == "screenshot":
                 pyautogui.screenshot("screenshot.png")
                 return {"success": True, "message": "Screenshot saved"}
@@ -193,38 +328,30 @@ class CommandExecutor:
         pass
     def _parse_time(self, time_str):
         """Parse time string to datetime"""
-        # Try ISO format first
-        try:
-            return datetime.fromisoformat(time_str)
-        except:
-            pass
-        
-        # Try common formats
-        formats = [
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d %I:%M %p",
-            "%m/%d/%Y %H:%M",
-            "%m/%d/%Y %I:%M %p"
-        ]
-        
-        for fmt in formats:
+        # Classify the shape once and call the one parser that fits,
+        # instead of trying formats until one stops raising
+        text = time_str.strip()
+        
+        match = _ABSOLUTE_TIME_RE.fullmatch(text)
+        if match:
+            date, clock, meridiem = match.groups()
+            date_fmt = "%Y-%m-%d" if "-" in date else "%m/%d/%Y"
+            if meridiem:
+                return datetime.strptime(f"{date} {clock} {meridiem}", f"{date_fmt} %I:%M %p")
+            return datetime.strptime(f"{date} {clock}", f"{date_fmt} %H:%M")
+        
+        # Other ISO shapes (date only, "T" separator, seconds)
+        if _ISO_DATE_RE.match(text):
             try:
-                return datetime.strptime(time_str, fmt)
-            except:
-                continue
+                return datetime.fromisoformat(text)
+            except ValueError:
+                pass
         
         # Handle relative times
-        if "in" in time_str.lower():
-            match = re.search(r'in (\d+) (minute|hour|day)s?', time_str.lower())
-            if match:
-                amount = int(match.group(1))
-                unit = match.group(2)
-                
-                if unit == "minute":
-                    return datetime.now() + timedelta(minutes=amount)
-                elif unit == "hour":
-                    return datetime.now() + timedelta(hours=amount)
-                elif unit == "day":
-                    return datetime.now() + timedelta(days=amount)
+        match = _RELATIVE_TIME_RE.search(text)
+        if match:
+            amount = int(match.group(1))
+            unit = match.group(2).lower()
+            return datetime.now() + timedelta(**{f"{unit}s": amount})
         
         raise ValueError(f"Could not parse time: {time_str}")
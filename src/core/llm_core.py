@@ -1,48 +1,31 @@
-import json
+import atexit
 import os
+import re
+import httpx
 from openai import OpenAI
 from src.core.logger_config import get_logger
+from src.core.quick_intents import match_quick_intent
+from src.utils import fast_json
 from datetime import datetime
 
 logger = get_logger(__name__)
+# Immutable and ordered (a frozenset's order varies between runs, which
+# would change the prompt text and defeat the prompt cache)
 try:
-    from src.utils.apps_config import list_available_apps, APPLICATIONS
-    INSTALLED_APPS = list(APPLICATIONS.keys())
+    from src.utils.apps_config import APPLICATIONS
+    INSTALLED_APPS = tuple(APPLICATIONS)
 except ImportError:
-    INSTALLED_APPS = ["chrome", "notepad", "calculator"] 
+    INSTALLED_APPS = ("chrome", "notepad", "calculator")
+APPS_STR = ", ".join(INSTALLED_APPS)
 
-class LLMCore:
-    def __init__(self, memory_manager):
-        self.client = OpenAI(
-            base_url="http://localhost:11434/v1",
-            api_key="ollama"
-        )
-        self.model = "llama3.2" 
-        self.memory_manager = memory_manager
-        self.conversation_history = [
-            {"role": "system", "content": self._get_system_prompt()}
-        ]
-
-    def update_memory_context(self):
-        """Update the system prompt with latest memories"""
-        self.conversation_history[0] = {"role": "system", "content": self._get_system_prompt()}
-
-    def _get_system_prompt(self):
-        apps_str = ", ".join(INSTALLED_APPS)
-        memories = self.memory_manager.get_memory_string()
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        day_of_week = datetime.now().strftime("%A")
-        
-        return f"""
+# Static system prompt (app list baked in once). It never changes, so the
+# server can reuse its prompt cache for it every turn; memories and the clock
+# follow in their own messages (see LLMCore._build_messages)
+STATIC_SYSTEM_PROMPT = f"""
         You are JARVIS. Output JSON only.
         
-        CURRENT DATE AND TIME: {current_time} ({day_of_week})
-        
-        USER MEMORY (Facts you know about the user):
-        {memories}
-        
         AVAILABLE ACTIONS:
-        1. "open": Open app (target: {apps_str})
+        1. "open": Open app (target: {APPS_STR})
         2. "system": volume_up, volume_down, mute, screenshot
         3. "search": Web search (query)
         
@@ -91,9 +74,8 @@ class LLMCore:
             - User: "What is on my screen?" or "Explain this error" or "Summarize this text"
             - Params: query (string, what to look for)
         
-        RESPONSE FORMAT:
+        RESPONSE FORMAT (keep "intent" before "response"):
         {{
-            "response": "Spoken response to user",
             "intent": {{
                 "action": "open|system|search|track_expense|ask_finance|remember|weather|smart_search|set_reminder|set_timer|list_reminders|analyze_screen|chat",
                 "target": "val", "amount": 0, "currency": "$",
@@ -103,36 +85,190 @@ class LLMCore:
                 "text": "val", "time": "YYYY-MM-DD HH:MM", "recurring": "daily|weekly|monthly",
                 "duration_minutes": 0, "label": "val",
                 "success": true
-            }}
+            }},
+            "response": "Spoken response to user"
         }}
         """
 
-    def process(self, user_text):
+STATIC_SYSTEM_MESSAGE = {"role": "system", "content": STATIC_SYSTEM_PROMPT}
+
+# Conversation window: grows to HISTORY_WINDOW_MAX messages, then snaps back
+# to the newest HISTORY_WINDOW_MIN. Between resets each request's messages are
+# the previous request's plus the new turn, so the prompt cache keeps hitting
+# (a sliding window would shift the whole history every turn)
+HISTORY_WINDOW_MIN = 6
+HISTORY_WINDOW_MAX = 12
+
+# Complete "response" string field in a (possibly partial) streamed JSON reply.
+# The prompt puts "intent" first, so by the time this matches the intent
+# object before it is complete too.
+RESPONSE_FIELD_RE = re.compile(r'"response"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL)
+
+def _leading_intent(prefix):
+    """
+    Intent object from the part of a streamed reply before "response"
+    ('{"intent": {...},'), or None if it isn't there or isn't complete
+    """
+    try:
+        intent = fast_json.loads(prefix.rstrip().rstrip(",") + "}").get("intent")
+    except (fast_json.JSONDecodeError, AttributeError):
+        return None
+    return intent if isinstance(intent, dict) else None
+
+class LLMCore:
+    def __init__(self, memory_manager):
+        # One client for every turn; keep the socket to Ollama open between turns
+        # Connect fails fast if Ollama is down; reads allow for slow generations
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32, keepalive_expiry=300.0),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+        atexit.register(self.close)
+        self.client = OpenAI(
+            base_url="http://localhost:11434/v1",
+            api_key="ollama",
+            http_client=self.http_client
+        )
+        self.model = "llama3.2" 
+        self.memory_manager = memory_manager
+        self._memory_version = None
+        self.memory_message = None
+        self.update_memory_context()
+        # Recent turns, trimmed in steps by _trim_history
+        self.conversation_history = []
+
+    def close(self):
+        """Close the pooled connections to Ollama"""
+        self.http_client.close()
+
+    def update_memory_context(self):
+        """Rebuild the memory message with the latest memories"""
+        self._memory_version = self.memory_manager.version
+        self.memory_message = {
+            "role": "system",
+            "content": f"USER MEMORY (Facts you know about the user):\n{self.memory_manager.get_memory_string()}"
+        }
+
+    def _build_messages(self):
+        """
+        Static prompt, memories, the recent conversation, with the clock just
+        before the newest user message
+        
+        Ordered from least to most often changing, so the server's prompt
+        cache covers everything up to the newest turn. The clock (at minute
+        resolution) changes between turns, so it sits right before the newest
+        user turn instead of after it, where chat templates may drop it or
+        weigh it above the user's request.
+        """
+        if self.memory_manager.version != self._memory_version:
+            self.update_memory_context()
+        now = datetime.now()
+        clock_message = {
+            "role": "system",
+            "content": f"CURRENT DATE AND TIME: {now:%Y-%m-%d %H:%M} ({now:%A})"
+        }
+        history = self.conversation_history
+        newest_user = next(
+            (i for i in range(len(history) - 1, -1, -1) if history[i]["role"] == "user"),
+            len(history)
+        )
+        return [
+            STATIC_SYSTEM_MESSAGE, self.memory_message,
+            *history[:newest_user], clock_message, *history[newest_user:]
+        ]
+
+    def process(self, user_text, on_response=None):
+        """
+        Send user text to the LLM and return the parsed JSON decision.
+        
+        If on_response is given, the completion is streamed and
+        on_response(text, intent) is called as soon as the "response" field is
+        complete, before the rest of the reply has arrived. intent is the
+        already-generated intent dict, or None if the model put it after the
+        response (the caller then can't know yet what the reply leads to).
+        
+        Templated commands ("open chrome", "volume up") are answered by
+        match_quick_intent without calling the LLM.
+        """
+        quick = match_quick_intent(user_text)
+        if quick is not None:
+            # Recorded like an LLM turn so later replies have the context
+            self.conversation_history.append({"role": "user", "content": user_text})
+            self.conversation_history.append({"role": "assistant", "content": fast_json.dumpb(quick).decode("utf-8")})
+            self._trim_history()
+            if on_response:
+                on_response(quick["response"], quick["intent"])
+            return quick
+        
         self.conversation_history.append({"role": "user", "content": user_text})
-        if len(self.conversation_history) > 10:
-            self.conversation_history = [self.conversation_history[0]] + self.conversation_history[-5:]
 
         try:
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=self.conversation_history,
-                response_format={"type": "json_object"},
-                temperature=0.1
-            )
-            response_content = completion.choices[0].message.content
+            if on_response:
+                response_content = self._stream_completion(on_response)
+            else:
+                completion = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=self._build_messages(),
+                    response_format={"type": "json_object"},
+                    temperature=0.1
+                )
+                response_content = completion.choices[0].message.content
             self.conversation_history.append({"role": "assistant", "content": response_content})
+            self._trim_history()
             
             try:
-                return json.loads(response_content)
-            except json.JSONDecodeError:
+                return fast_json.loads(response_content)
+            except fast_json.JSONDecodeError:
                 clean = response_content.replace("```json", "").replace("```", "").strip()
-                return json.loads(clean)
+                return fast_json.loads(clean)
         except Exception as e:
             logger.error(f"LLM Error: {e}")
             with open("llm_debug_error.txt", "w") as f:
                 f.write(str(e))
             return {"response": "Error processing.", "intent": {"success": False}}
 
+    def _stream_completion(self, on_response):
+        """Stream the completion, emitting the "response" field (and the intent before it) early. Returns the full text."""
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(),
+            response_format={"type": "json_object"},
+            temperature=0.1,
+            stream=True
+        )
+        
+        parts = []
+        emitted = False
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            
+            # The field can only have closed on a chunk containing a quote
+            if not emitted and '"' in delta:
+                streamed = "".join(parts)
+                match = RESPONSE_FIELD_RE.search(streamed)
+                if match:
+                    emitted = True
+                    try:
+                        text = fast_json.loads(f'"{match.group(1)}"')
+                    except fast_json.JSONDecodeError:
+                        text = match.group(1)
+                    if text:
+                        on_response(text, _leading_intent(streamed[:match.start()]))
+        
+        return "".join(parts)
+
     def add_entry(self, role, content):
         """Manually add an entry to conversation history"""
-        self.conversation_history.append({"role": role, "content": content})
\ No newline at end of file
+        self.conversation_history.append({"role": role, "content": content})
+        self._trim_history()
+
+    def _trim_history(self):
+        """Drop back to the newest HISTORY_WINDOW_MIN messages once past the maximum"""
+        if len(self.conversation_history) > HISTORY_WINDOW_MAX:
+            logger.debug(f"History window reset at {len(self.conversation_history)} messages")
+            del self.conversation_history[:-HISTORY_WINDOW_MIN]
\ No newline at end of file
@@ -3,12 +3,17 @@ Centralized Logging Configuration for JARVIS
 Provides consistent logging across all modules
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 
+# Background thread that writes queued records to the real handlers
+_listener = None
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
@@ -23,12 +28,31 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    # Colored level names, built once ('\033[0m' is COLORS['RESET'];
+    # class attributes aren't visible inside the comprehension)
+    COLORED_LEVELS = {
+        level: f"{color}{level}\033[0m"
+        for level, color in COLORS.items() if level != 'RESET'
+    }
+    
+    def __init__(self, fmt=None, datefmt=None, use_color=None):
+        super().__init__(fmt, datefmt)
+        # No escape codes when the console is redirected to a file or pipe
+        self.use_color = sys.stdout.isatty() if use_color is None else use_color
+    
     def format(self, record):
-        # Add color to level name
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.COLORS['RESET']}"
+        colored = self.COLORED_LEVELS.get(record.levelname) if self.use_color else None
+        if colored is None:
+            return super().format(record)
         
-        return super().format(record)
+        # The record is shared with the file handler, so restore the plain
+        # level name once this handler is done with it
+        levelname = record.levelname
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logging(
@@ -62,7 +86,11 @@ def setup_logging(
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG)  # Capture everything, filter at handler level
     
-    # Remove existing handlers
+    # Remove existing handlers (and stop the writer from a previous setup)
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
     logger.handlers.clear()
     
     # File handler with rotation
@@ -92,9 +120,12 @@ def setup_logging(
     )
     console_handler.setFormatter(console_format)
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Loggers only enqueue records; the file and console writes (and log
+    # rotation) happen on the listener thread, off the audio/LLM loop
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    logger.addHandler(QueueHandler(log_queue))
     
     # Log startup
     logger.info("="*70)
@@ -107,6 +138,15 @@ def setup_logging(
     return logger
 
 
+def _stop_listener():
+    """Write out queued records before the interpreter exits"""
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name):
     """
     Get a logger for a specific module
@@ -0,0 +1,157 @@
+"""
+Quick intents - regex templates for commands that need no LLM
+
+"Open chrome", "volume up" or "set a timer for 10 minutes" map to exactly one
+intent, so they are answered in well under a millisecond instead of a full
+LLM round trip. Anything that doesn't match a template goes to the LLM.
+
+COMMAND_RULES is the single table of templated commands. match_command()
+returns a neutral (command, params) pair; match_quick_intent() turns it into
+an LLMCore decision, and the orchestrator's FastRouter into a routing decision.
+"""
+
+import re
+
+from src.utils.apps_config import get_app_from_alias
+
+# Wake word, politeness and trailing punctuation around the actual command
+_PREFIX_RE = re.compile(r"^(?:(?:hey|ok|okay)\s+)?(?:jarvis\W*\s*)?(?:please\s+|can you\s+|could you\s+)?")
+_SUFFIX_RE = re.compile(r"(?:\s+please)?[\s.!?,]*$")
+
+_SYSTEM_COMMANDS = {
+    "volume up": "volume_up",
+    "turn up the volume": "volume_up",
+    "turn the volume up": "volume_up",
+    "turn volume up": "volume_up",
+    "volume down": "volume_down",
+    "turn down the volume": "volume_down",
+    "turn the volume down": "volume_down",
+    "turn volume down": "volume_down",
+    "mute": "mute",
+    "mute the volume": "mute",
+    "mute the sound": "mute",
+    "take a screenshot": "screenshot",
+    "screenshot": "screenshot",
+}
+
+_SYSTEM_REPLIES = {
+    "volume_up": "Turning the volume up.",
+    "volume_down": "Turning the volume down.",
+    "mute": "Muting.",
+    "screenshot": "Taking a screenshot.",
+}
+
+
+def _minutes(match):
+    amount = int(match["amount"])
+    return amount * 60 if match["unit"].startswith("hour") else amount
+
+
+# (command, pattern, param builders); patterns are matched against the whole
+# normalized command. A builder returning None rejects the match: the words
+# fit a template but not a real command ("start a timer" names no app).
+COMMAND_RULES = (
+    ("open_app", re.compile(r"(?:open|launch|start)\s+(?P<app>[\w ]+?)"),
+     {"app": lambda m: get_app_from_alias(m["app"])}),
+    ("close_app", re.compile(r"(?:close|quit|exit|kill)\s+(?P<app>[\w ]+?)"),
+     {"app": lambda m: get_app_from_alias(m["app"])}),
+    ("system", re.compile("|".join(map(re.escape, sorted(_SYSTEM_COMMANDS, key=len, reverse=True)))),
+     {"command": lambda m: _SYSTEM_COMMANDS[m[0]]}),
+    ("timer", re.compile(r"(?:set\s+)?(?:a\s+)?timer\s+for\s+(?P<amount>\d+)\s+(?P<unit>minutes?|mins?|hours?)"),
+     {"amount": lambda m: int(m["amount"]), "minutes": _minutes,
+      "unit": lambda m: "hour" if m["unit"].startswith("hour") else "minute"}),
+    ("search", re.compile(r"(?:search(?:\s+the\s+web|\s+online)?\s+for|google)\s+(?P<query>.+)"),
+     {"query": lambda m: m["query"]}),
+    ("track_expense", re.compile(r"i\s+(?:spent|paid)\s+\$?(?P<amount>\d+(?:\.\d+)?)(?:\s*dollars)?\s+(?:on|for)\s+(?P<category>[a-z]+)"),
+     {"amount": lambda m: float(m["amount"]), "category": lambda m: m["category"]}),
+)
+
+
+def normalize_command(text):
+    """Lowercase, collapse whitespace and strip the wake word, politeness and punctuation"""
+    return _SUFFIX_RE.sub("", _PREFIX_RE.sub("", " ".join(text.lower().split())))
+
+
+def match_command(text):
+    """
+    Match text against COMMAND_RULES.
+
+    Returns None if no template fits, (command, params) for a templated
+    command, or (command, None) if a template fits but its params don't
+    validate; either way without a match the caller should ask the LLM.
+    """
+    command = normalize_command(text)
+    if not command:
+        return None
+
+    for name, pattern, builders in COMMAND_RULES:
+        match = pattern.fullmatch(command)
+        if match is None:
+            continue
+        params = {}
+        for key, build in builders.items():
+            value = build(match)
+            if value is None:
+                return name, None
+            params[key] = value
+        return name, params
+
+    return None
+
+
+def _open(params):
+    app = params["app"]
+    return {"action": "open", "target": app}, f"Opening {app}."
+
+
+def _close(params):
+    app = params["app"]
+    return {"action": "close", "target": app}, f"Closing {app}."
+
+
+def _system(params):
+    command = params["command"]
+    return {"action": "system", "target": command}, _SYSTEM_REPLIES[command]
+
+
+def _timer(params):
+    amount, unit = params["amount"], params["unit"]
+    if amount != 1:
+        unit += "s"
+    return (
+        {"action": "set_timer", "duration_minutes": params["minutes"], "label": "Timer"},
+        f"Timer set for {amount} {unit}."
+    )
+
+
+def _search(params):
+    query = params["query"]
+    return {"action": "search", "query": query}, f"Searching for {query}."
+
+
+# Command -> LLMCore intent builder; commands not listed here go to the LLM
+QUICK_INTENTS = {
+    "open_app": _open,
+    "close_app": _close,
+    "system": _system,
+    "timer": _timer,
+    "search": _search,
+}
+
+
+def match_quick_intent(text):
+    """
+    Return an LLM-shaped decision ({"response", "intent"}) for a templated
+    command, or None if the LLM should handle it
+    """
+    matched = match_command(text)
+    if matched is None:
+        return None
+    name, params = matched
+    build = QUICK_INTENTS.get(name)
+    if params is None or build is None:
+        return None
+
+    intent, response = build(params)
+    intent["success"] = True
+    return {"response": response, "intent": intent}
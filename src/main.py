@@ -1,5 +1,9 @@
 import sys
 import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 os.environ['KMP_DUPLICATE_LIB_OK'] = 'TRUE'
 
 from src.modules.speech_to_text import SpeechToText
@@ -11,6 +15,36 @@ from src.core.llm_core import LLMCore
 from src.modules.tts_engine import TextToSpeech
 from src.modules.memory_manager import MemoryManager
 
+# Actions whose spoken reply is regenerated from the tool output
+FOLLOW_UP_ACTIONS = {"list_reminders", "ask_finance", "analyze_screen", "weather", "smart_search"}
+
+def _needs_follow_up(intent):
+    """True if the spoken reply will be regenerated from the action's result"""
+    return bool(intent.get("success")) and intent.get("action") in FOLLOW_UP_ACTIONS
+
+# Reminders named individually in the startup greeting
+STARTUP_SUMMARY_LIMIT = 3
+
+def _format_startup_summary(upcoming, now=None):
+    """Spoken greeting listing the soonest reminders (upcoming is sorted by time)"""
+    now = now or datetime.now()
+    part_of_day = "morning" if now.hour < 12 else "afternoon" if now.hour < 18 else "evening"
+    
+    items = []
+    for reminder in upcoming[:STARTUP_SUMMARY_LIMIT]:
+        when = datetime.fromisoformat(reminder['time'])
+        clock = when.strftime("%I:%M %p").lstrip("0")
+        day = " tomorrow" if when.date() > now.date() else ""
+        items.append(f"{reminder['text']} at {clock}{day}")
+    
+    extra = len(upcoming) - len(items)
+    if extra:
+        items.append(f"{extra} more")
+    listed = items[0] if len(items) == 1 else ", ".join(items[:-1]) + f" and {items[-1]}"
+    
+    count = len(upcoming)
+    return f"Good {part_of_day}, sir. You have {count} upcoming {'task' if count == 1 else 'tasks'}: {listed}."
+
 class JarvisAgent:
     def __init__(self, use_wake_word=True, feedback_system=None, on_amplitude=None):
         self.feedback = feedback_system if feedback_system else FeedbackSystem()
@@ -50,14 +84,29 @@ class JarvisAgent:
         self.feedback.print_command(transcription)
         self.feedback.print_status("Thinking...", "info")
         
-        # Get decision from Brain
-        decision = self.llm.process(transcription)
+        # Get decision from Brain, speaking the reply as soon as it streams in.
+        # The intent is generated first, so we already know whether a follow-up
+        # will replace the reply; if it isn't known yet, wait for the full answer.
+        streamed = []
+        def on_response(text, streamed_intent):
+            if streamed_intent is not None and not _needs_follow_up(streamed_intent):
+                streamed.append(text)
+                self.tts.speak(text)
+        
+        decision = self.llm.process(transcription, on_response=on_response)
         self.feedback.clear_thinking()
         
         intent = decision.get("intent", {})
         response_text = decision.get("response", "")
+        reply_spoken = bool(streamed)
+        
+        # Otherwise start speaking now if the reply doesn't depend on the action result,
+        # so TTS synthesis overlaps with executing the action (speak() is non-blocking)
+        if response_text and not reply_spoken and not _needs_follow_up(intent):
+            self.tts.speak(response_text)
+            reply_spoken = True
         
-        # 1. Execute Action First (to get data)
+        # 1. Execute Action (to get data)
         result_message = ""
         if intent.get("success") and intent.get("action") != "chat":
             self.feedback.print_action(intent.get("action"), intent.get("target"))
@@ -69,11 +118,24 @@ class JarvisAgent:
             
             # RE-PROMPT: If the user asked for analysis/advice (implied by certain actions),
             # we should ask the LLM to generate a follow-up response based on the data.
-            if intent.get("action") in ["list_reminders", "ask_finance", "analyze_screen", "weather", "smart_search"]:
-                # Generate a new response based on the tool output
-                follow_up = self.llm.process("Based on this result, please provide a brief summary or advice to the user.")
+            if intent.get("action") in FOLLOW_UP_ACTIONS:
+                # Generate a new response based on the tool output, streamed like the
+                # first reply so speech starts while the intent block is generated
+                follow_up_spoken = False
+                def on_follow_up(text, _intent):
+                    nonlocal follow_up_spoken
+                    follow_up_spoken = True
+                    self.tts.speak(text)
+                
+                follow_up = self.llm.process(
+                    "Based on this result, please provide a brief summary or advice to the user.",
+                    on_response=on_follow_up
+                )
                 if follow_up.get("response"):
                     response_text = follow_up.get("response")
+                    # Already spoken while streaming; the decoded text may differ
+                    # slightly from the parsed one, so don't compare strings
+                    reply_spoken = follow_up_spoken
             
             # Special case for ask_finance: if we didn't re-prompt, use the raw result
             elif intent.get("action") == "ask_finance" and not response_text:
@@ -83,8 +145,8 @@ class JarvisAgent:
             if intent.get("action") == "remember":
                 self.llm.update_memory_context()
 
-        # 2. Speak Response
-        if response_text:
+        # 2. Speak Response (if it had to wait for the action result)
+        if response_text and not reply_spoken:
             self.tts.speak(response_text)
         
         if result_message:
@@ -110,24 +172,14 @@ class JarvisAgent:
             upcoming = self.executor.reminders.get_upcoming_reminders(hours=24)
             
             if upcoming:
-                # Format for LLM
-                tasks_str = "\n".join([f"- {r['text']} at {r['time']}" for r in upcoming])
-                
-                # Ask LLM to summarize
-                prompt = f"""
-                The user has just started the system. 
-                Here are their upcoming tasks for the next 24 hours:
-                {tasks_str}
-                
-                Please provide a brief, friendly greeting and a summary of these tasks. 
-                Prioritize the most urgent ones.
-                Keep it under 2 sentences.
-                """
+                # Formatted locally: a full LLM round trip just to read out a list
+                # would delay startup by seconds
+                summary = _format_startup_summary(upcoming)
+                self.tts.speak(summary)
+                self.feedback.print_status(summary, "info")
                 
-                response = self.llm.process(prompt)
-                if response.get("response"):
-                    self.tts.speak(response.get("response"))
-                    self.feedback.print_status(response.get("response"), "info")
+                # Let the LLM know what the user has already been told
+                self.llm.add_entry("system", f"At startup the user was told: {summary}")
             else:
                 # Optional: Just say hello if no tasks
                 # self.tts.speak("No upcoming tasks for today, sir.")
@@ -154,14 +206,72 @@ class JarvisAgent:
                         self.feedback.print_status("Waiting...", "wake")
             except KeyboardInterrupt: pass
         else:
+            try:
+                asyncio.run(self.run_async())
+            except (KeyboardInterrupt, EOFError): pass
+
+    async def run_async(self):
+        """Push-to-talk loop driven by an asyncio event loop instead of blocking input()"""
+        loop = asyncio.get_running_loop()
+        # Own executor rather than the loop's default one: asyncio.run() waits for
+        # the default executor on exit, which would hang Ctrl+C behind a recording
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jarvis")
+        
+        try:
             # Check for tasks immediately on startup
-            self.check_startup_tasks()
+            await loop.run_in_executor(executor, self.check_startup_tasks)
             
             while True:
-                input("\nPress Enter to speak...")
+                await self._wait_for_enter()
                 self.feedback.print_status("Listening...", "listening")
-                audio_file = self.listener.record_with_vad(max_duration=60)
-                if audio_file: self.process_command(audio_file)
+                # PortAudio capture, Whisper and the LLM all block, so keep them off the loop
+                audio_file = await loop.run_in_executor(executor, self.listener.record_with_vad, 60)
+                if audio_file: await loop.run_in_executor(executor, self.process_command, audio_file)
+        finally:
+            # Let an in-flight recording return instead of running to max_duration
+            self.listener.stop()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _wait_for_enter(self):
+        """Wait for Enter on stdin without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        print("\nPress Enter to speak...", end="", flush=True)
+        
+        line = loop.create_future()
+        try:
+            fd = sys.stdin.fileno()
+            loop.add_reader(fd, self._read_stdin, fd, line)
+        except (NotImplementedError, ValueError, OSError):
+            # Proactor loop (Windows) can't watch stdin; read it on a daemon thread
+            # so a pending read never holds up exit
+            def read_line():
+                text = sys.stdin.readline()
+                loop.call_soon_threadsafe(lambda: line.done() or line.set_result(text))
+            threading.Thread(target=read_line, daemon=True).start()
+            text = await line
+        else:
+            try:
+                text = await line
+            finally:
+                loop.remove_reader(fd)
+        
+        if not text:
+            raise EOFError
+
+    def _read_stdin(self, fd, line):
+        """
+        add_reader callback: read the raw fd, which returns whatever is
+        available. sys.stdin.readline() could block the loop on a partial line
+        and leaves buffered input that add_reader never reports.
+        """
+        data = os.read(fd, 4096)
+        if line.done():
+            return
+        if not data:
+            line.set_result("")  # EOF
+        elif b"\n" in data:
+            line.set_result(data.decode(errors="replace"))
+        # Otherwise keep waiting for the rest of the line
 
 if __name__ == "__main__":
     # Initialize logging system
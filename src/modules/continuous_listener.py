@@ -9,6 +9,7 @@ import sounddevice as sd
 import numpy as np
 import wave
 import time
+import threading
 from src.utils.vad_detector import VADDetector
 from src.utils.config import SAMPLE_RATE, RECORDINGS_DIR, TEMP_AUDIO_FILE
 import os
@@ -25,6 +26,8 @@ class ContinuousListener:
         self.vad = VADDetector(sample_rate=sample_rate)
         self.is_recording = False
         self.audio_chunks = []
+        # Set by stop() to end a recording from another thread (e.g. on Ctrl+C)
+        self._stop_event = threading.Event()
         
         # Ensure recordings directory exists
         os.makedirs(RECORDINGS_DIR, exist_ok=True)
@@ -49,9 +52,13 @@ class ContinuousListener:
         sd.wait()
         
         # Auto-adjust threshold
-        self.vad.auto_adjust_threshold(recording.flatten())
+        self.vad.auto_adjust_threshold(recording.reshape(-1))
         logger.info("VAD calibrated!")
     
+    def stop(self):
+        """Make the current and any later record_with_vad() call return None promptly"""
+        self._stop_event.set()
+    
     def record_with_vad(self, max_duration=5.0, pre_speech_buffer=0.5):
         """
         Record audio with automatic speech detection
@@ -69,54 +76,80 @@ class ContinuousListener:
         chunk_samples = int(self.sample_rate * chunk_duration)
         max_chunks = int(max_duration / chunk_duration)
         
-        audio_buffer = []
         speech_detected = False
-        speech_chunks = []
+        speech_start = 0
         silence_count = 0
         max_silence_chunks = int(self.vad.silence_duration / chunk_duration)
         
         # Pre-speech buffer size
         pre_buffer_size = int(pre_speech_buffer / chunk_duration)
         
+        # PortAudio's callback writes straight into this preallocated buffer;
+        # the loop below runs VAD on chunk views as they fill in
+        total_samples = max_chunks * chunk_samples
+        audio_data = np.empty(total_samples, dtype=np.int16)
+        filled = 0
+        overflowed = False
+        data_ready = threading.Event()
+        
+        def audio_callback(indata, frames, time_info, status):
+            nonlocal filled, overflowed
+            if status.input_overflow:
+                overflowed = True
+            count = min(frames, total_samples - filled)
+            audio_data[filled:filled + count] = indata[:count, 0]
+            filled += count
+            data_ready.set()
+            if filled >= total_samples:
+                raise sd.CallbackStop
+        
         try:
             with sd.InputStream(samplerate=self.sample_rate,
                                channels=1,
-                               dtype='int16') as stream:
+                               dtype='int16',
+                               blocksize=chunk_samples,
+                               callback=audio_callback) as stream:
                 
                 for i in range(max_chunks):
-                    # Read audio chunk
-                    chunk, overflowed = stream.read(chunk_samples)
+                    chunk_end = (i + 1) * chunk_samples
+                    
+                    # Wait for the callback to deliver this chunk
+                    while filled < chunk_end and stream.active and not self._stop_event.is_set():
+                        data_ready.wait(timeout=0.5)
+                        data_ready.clear()
+                    if self._stop_event.is_set():
+                        return None
+                    if filled < chunk_end:
+                        break
                     
                     if overflowed:
                         logger.info("Audio overflow detected")
+                        overflowed = False
                     
-                    # Add to circular buffer
-                    audio_buffer.append(chunk)
-                    if len(audio_buffer) > pre_buffer_size:
-                        audio_buffer.pop(0)
+                    # View of the chunk (no copy)
+                    samples = audio_data[chunk_end - chunk_samples:chunk_end]
                     
                     # Check for speech
-                    is_speech = self.vad.is_speech(chunk.flatten())
+                    is_speech = self.vad.is_speech(samples)
                     
                     if not speech_detected and is_speech:
                         # Speech started!
                         speech_detected = True
                         logger.info("Speech detected!")
                         
-                        # Add pre-speech buffer to recording
-                        speech_chunks.extend(audio_buffer)
-                        audio_buffer = []
+                        # Keep the pre-speech chunks that precede this one
+                        speech_start = max(0, i - pre_buffer_size) * chunk_samples
                         
                     elif not speech_detected:
                         # We are in silence/noise before speech
                         # Adaptively calibrate to this background noise
-                        self.vad.adapt_threshold(chunk.flatten())
+                        self.vad.adapt_threshold(samples)
                     
                     if speech_detected:
-                        speech_chunks.append(chunk)
+                        speech_end = chunk_end
                         
                         # Show progress
-                        if len(speech_chunks) % 10 == 0:
+                        if ((speech_end - speech_start) // chunk_samples) % 10 == 0:
                             print(".", end="", flush=True)
                         
                         if not is_speech:
@@ -130,12 +163,12 @@ class ContinuousListener:
                             break
                 
                 # Check if we recorded anything
-                if not speech_chunks:
+                if not speech_detected:
                     logger.info("No speech detected")
                     return None
                 
-                # Concatenate all chunks
-                audio_data = np.concatenate(speech_chunks, axis=0)
+                # Recorded samples, pre-speech buffer included (view, no copy)
+                recording = audio_data[speech_start:speech_end]
                 
                 # Save to file
                 filename = TEMP_AUDIO_FILE
@@ -143,9 +176,9 @@ class ContinuousListener:
                     wf.setnchannels(1)
                     wf.setsampwidth(2)  # 16-bit
                     wf.setframerate(self.sample_rate)
-                    wf.writeframes(audio_data.tobytes())
+                    wf.writeframes(recording.tobytes())
                 
-                duration = len(audio_data) / self.sample_rate
+                duration = len(recording) / self.sample_rate
                 logger.info(f"Recorded {duration:.1f}s of audio")
                 
                 return filename
@@ -7,6 +7,7 @@ Upgraded from CSV for better performance, data integrity, and analytics
 """
 
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -33,8 +34,38 @@ class FinanceManagerSQL:
         self.db_file = db_file
         self.conn = sqlite3.connect(db_file, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row  # Access columns by name
+        
+        # WAL: one sequential log write per commit, and readers don't block writers
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA busy_timeout=5000")
+        
+        # Read-only connection per thread (see _reader), so analyses running on
+        # several threads read the WAL side by side instead of sharing self.conn
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        
         self._init_database()
     
+    def _reader(self):
+        """This thread's read-only connection, opened on first use"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.db_file == ":memory:":
+                return self.conn  # A private in-memory database can't be reopened
+            conn = sqlite3.connect(
+                f"{Path(self.db_file).resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False  # close() may run on another thread
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+    
     def _init_database(self):
         """Create database schema if it doesn't exist"""
         
@@ -79,38 +110,61 @@ class FinanceManagerSQL:
         Returns:
             dict: Success status and message
         """
-        try:
-            now = datetime.now()
-            date_str = now.strftime("%Y-%m-%d")
-            time_str = now.strftime("%H:%M:%S")
-            
-            # Default values
+        result = self.log_transactions([{
+            "amount": amount,
+            "currency": currency,
+            "category": category,
+            "description": description
+        }])
+        
+        if result["success"]:
             if not category:
                 category = "Uncategorized"
             if not description:
                 description = category
+            result["message"] = f"Logged {currency}{amount} expense for {description}"
+        return result
+    
+    def log_transactions(self, transactions):
+        """
+        Log several expense transactions in a single database transaction
+        
+        Args:
+            transactions: List of dicts with amount, currency, category, description
+            
+        Returns:
+            dict: Success status and message (all rows are saved or none)
+        """
+        try:
+            now = datetime.now()
+            date_str = now.strftime("%Y-%m-%d")
+            time_str = now.strftime("%H:%M:%S")
             
-            # Insert transaction
-            self.conn.execute('''
-                INSERT INTO transactions (date, time, amount, currency, category, description)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (date_str, time_str, amount, currency, category, description))
+            rows = []
+            for tx in transactions:
+                # Default values
+                category = tx.get("category") or "Uncategorized"
+                description = tx.get("description") or category
+                rows.append((date_str, time_str, tx.get("amount"), tx.get("currency", "$"), category, description))
             
-            self.conn.commit()
+            # Insert transactions (one commit for the whole batch)
+            with self.conn:
+                self.conn.executemany('''
+                    INSERT INTO transactions (date, time, amount, currency, category, description)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', rows)
             
             return {
                 "success": True,
-                "message": f"Logged {currency}{amount} expense for {description}"
+                "message": f"Logged {len(rows)} transactions"
             }
             
         except sqlite3.IntegrityError as e:
-            self.conn.rollback()
             return {
                 "success": False,
                 "message": f"Invalid data: {e}"
             }
         except Exception as e:
-            self.conn.rollback()
             return {
                 "success": False,
                 "message": f"Error logging: {e}"
@@ -149,7 +203,7 @@ class FinanceManagerSQL:
             params.append(f"{current_month}%")
         
         # Execute query
-        result = self.conn.execute(query, params).fetchone()
+        result = self._reader().execute(query, params).fetchone()
         total = result['total'] or 0.0
         count = result['count'] or 0
         
@@ -199,7 +253,7 @@ class FinanceManagerSQL:
         
         query += " GROUP BY category ORDER BY total DESC"
         
-        results = self.conn.execute(query, params).fetchall()
+        results = self._reader().execute(query, params).fetchall()
         
         breakdown = []
         for row in results:
@@ -443,7 +497,11 @@ class FinanceManagerSQL:
         return stats
     
     def close(self):
-        """Close database connection"""
+        """Close database connections"""
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
         if self.conn:
             self.conn.close()
     
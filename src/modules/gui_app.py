@@ -4,40 +4,40 @@ import queue
 import sys
 import time
 from datetime import datetime
-from main import JarvisAgent
 from src.modules.feedback_system import FeedbackSystem
+from src.utils.tk_wake import TkWakeQueue
 
 # Configuration
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
 class GuiFeedback(FeedbackSystem):
-    def __init__(self, update_queue):
+    def __init__(self, post_update):
         super().__init__()
-        self.update_queue = update_queue
+        self.post_update = post_update
         
     def print_status(self, message, status="info"):
-        self.update_queue.put(("status", message, status))
+        self.post_update(("status", message, status))
         super().print_status(message, status)
 
     def print_command(self, text):
-        self.update_queue.put(("user", text))
+        self.post_update(("user", text))
         super().print_command(text)
 
     def print_action(self, action, target):
-        self.update_queue.put(("action", f"{action} -> {target}"))
+        self.post_update(("action", f"{action} -> {target}"))
         super().print_action(action, target)
         
     def show_thinking(self):
-        self.update_queue.put(("state", "Thinking..."))
+        self.post_update(("state", "Thinking..."))
         super().show_thinking()
         
     def clear_thinking(self):
-        self.update_queue.put(("state", "Ready"))
+        self.post_update(("state", "Ready"))
         super().clear_thinking()
 
     def activation_beep(self):
-        self.update_queue.put(("state", "Listening..."))
+        self.post_update(("state", "Listening..."))
         super().activation_beep()
 
 class JarvisGui(ctk.CTk):
@@ -190,8 +190,11 @@ class JarvisGui(ctk.CTk):
             outline=""
         )
 
-        # Queue for thread communication
-        self.update_queue = queue.Queue()
+        # Queue for thread communication; put() wakes the Tk thread, which
+        # then applies the updates (Tk calls aren't safe from worker threads)
+        self.update_queue = TkWakeQueue(self, self.check_queue)
+        # Latest mic level; only the newest value matters, so it skips the queue
+        self._latest_amplitude = None
         self.agent = None
         self.agent_thread = None
         self.is_muted = False
@@ -201,9 +204,10 @@ class JarvisGui(ctk.CTk):
         self.bind("<Control-m>", lambda e: self.toggle_mute())
         self.bind("<Control-l>", lambda e: self.toggle_theme())
         self.bind("<Control-c>", lambda e: self.clear_chat())
-        
-        # Start polling queue
-        self.after(50, self.check_queue) # Poll faster for visualizer
+
+    def post_update(self, msg):
+        """Queue an update from a worker thread and wake the Tk mainloop"""
+        self.update_queue.put(msg)
 
     def add_system_message(self, text):
         """Add system message to chat"""
@@ -241,15 +245,17 @@ class JarvisGui(ctk.CTk):
         self.agent_thread.start()
 
     def on_amplitude_update(self, amplitude):
-        """Callback for audio amplitude"""
-        try:
-            self.update_queue.put(("amplitude", amplitude))
-        except:
-            pass
+        """Callback for audio amplitude; coalesced to the latest value per wake-up"""
+        self._latest_amplitude = amplitude
+        self.update_queue.wake()
 
     def run_agent(self):
+        # Imported on the agent thread so the window opens before the
+        # assistant stack finishes loading
+        from main import JarvisAgent
+        
         # Initialize Custom Feedback
-        feedback = GuiFeedback(self.update_queue)
+        feedback = GuiFeedback(self.post_update)
         
         try:
             self.agent = JarvisAgent(
@@ -259,12 +265,12 @@ class JarvisGui(ctk.CTk):
             )
             
             # Enable manual listen button once initialized
-            self.update_queue.put(("ready", True))
+            self.post_update(("ready", True))
             
             # Run the agent loop
             self.agent.run()
         except Exception as e:
-            self.update_queue.put(("error", str(e)))
+            self.post_update(("error", str(e)))
 
     def toggle_mute(self):
         """Toggle microphone mute"""
@@ -366,6 +372,25 @@ class JarvisGui(ctk.CTk):
         self.chat_frame._parent_canvas.yview_moveto(1.0)
 
     def check_queue(self):
+        """Apply updates posted by worker threads since the last wake-up"""
+        amplitude, self._latest_amplitude = self._latest_amplitude, None
+        if amplitude is not None:
+            self._show_amplitude(amplitude)
+        self._drain_queue()
+
+    def _show_amplitude(self, amp):
+        # Update visualizer bar
+        # Canvas width is 100
+        width = int(amp) # amp is 0-100
+        self.visualizer_canvas.coords(self.visualizer_bar, 0, 10, width, 20)
+        
+        # Change color based on intensity
+        color = "#00d9ff"
+        if amp > 70: color = "#ff4444"
+        elif amp > 40: color = "#00ff88"
+        self.visualizer_canvas.itemconfig(self.visualizer_bar, fill=color)
+
+    def _drain_queue(self):
         try:
             while True:
                 msg_type, *data = self.update_queue.get_nowait()
@@ -408,23 +433,8 @@ class JarvisGui(ctk.CTk):
                     self.add_system_message(f"Error: {data[0]}")
                     self.system_status.configure(text="● Error", text_color="#ff4444")
                     
-                elif msg_type == "amplitude":
-                    amp = data[0]
-                    # Update visualizer bar
-                    # Canvas width is 100
-                    width = int(amp) # amp is 0-100
-                    self.visualizer_canvas.coords(self.visualizer_bar, 0, 10, width, 20)
-                    
-                    # Change color based on intensity
-                    color = "#00d9ff"
-                    if amp > 70: color = "#ff4444"
-                    elif amp > 40: color = "#00ff88"
-                    self.visualizer_canvas.itemconfig(self.visualizer_bar, fill=color)
-                    
         except queue.Empty:
             pass
-        
-        self.after(100, self.check_queue)
 
 if __name__ == "__main__":
     app = JarvisGui()
@@ -1,44 +1,206 @@
-import json
+import atexit
 import os
+import threading
+import time
+import weakref
+from src.utils import fast_json
+from src.core.logger_config import get_logger
 
-MEMORY_FILE = "memory.json"
+logger = get_logger(__name__)
+
+# One JSON-encoded fact per line, so adding a fact is a single append
+MEMORY_FILE = "memory.jsonl"
+LEGACY_MEMORY_FILE = "memory.json"
+
+# New facts are buffered and written at most this often (plus on exit)
+FLUSH_INTERVAL = 2.0
+
+# Live managers, flushed by one exit hook without being kept alive by it
+_INSTANCES = weakref.WeakSet()
+
+def _flush_all():
+    for manager in list(_INSTANCES):
+        manager.flush()
+
+atexit.register(_flush_all)
+
+# Parsed memories per path, keyed on (st_mtime_ns, st_size) so that every
+# MemoryManager in the process shares one parse until the file changes
+_PARSE_CACHE = {}
+
+def _file_signature(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
 
 class MemoryManager:
     def __init__(self):
         self.file_path = MEMORY_FILE
         self.memories = self._load_memories()
+        # Set mirror of self.memories for O(1) duplicate checks
+        self._index = set(self.memories)
+        # Bumped on every change so prompt builders know when to refresh
+        self.version = 0
+        # Formatted prompt block, rebuilt only after the memories change
+        self._cached_prompt = None
+        # Facts added since the last flush, written together in one append
+        self._pending = []
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        # Deferred flush, armed when the first unsaved fact arrives
+        self._flush_timer = None
+        self._lock = threading.RLock()
+        _INSTANCES.add(self)
 
     def _load_memories(self):
         if not os.path.exists(self.file_path):
+            return self._migrate_legacy_file()
+        try:
+            signature = _file_signature(self.file_path)
+            cached = _PARSE_CACHE.get(self.file_path)
+            if cached and cached[0] == signature:
+                return list(cached[1])
+            
+            with open(self.file_path, "rb") as f:
+                lines = [line for line in f.read().splitlines() if line.strip()]
+            
+            memories, bad_lines = [], []
+            for line in lines:
+                try:
+                    memories.append(fast_json.loads(line))
+                except (fast_json.JSONDecodeError, UnicodeDecodeError):
+                    bad_lines.append(line)
+            
+            if bad_lines:
+                self._drop_bad_lines(memories, bad_lines)
+            _PARSE_CACHE[self.file_path] = (_file_signature(self.file_path), tuple(memories))
+            return memories
+        except OSError as e:
+            logger.error(f"Could not read memory file: {e}")
+            return []
+
+    def _drop_bad_lines(self, memories, bad_lines):
+        """
+        Keep the facts that decoded and set the undecodable lines aside
+        (typically a write torn by a crash), so the next append can't glue
+        a new fact onto a broken line
+        """
+        corrupt_path = self.file_path + ".corrupt"
+        logger.warning(f"Skipped {len(bad_lines)} unreadable line(s) in memory file; saved them to {corrupt_path}")
+        try:
+            with open(corrupt_path, "ab") as f:
+                f.write(b"".join(line + b"\n" for line in bad_lines))
+            self.memories = memories
+            self.save_memories()
+        except OSError as e:
+            logger.error(f"Could not rewrite memory file: {e}")
+
+    def _update_parse_cache(self, memories):
+        """Record what the file now holds so other instances skip re-parsing it"""
+        try:
+            _PARSE_CACHE[self.file_path] = (_file_signature(self.file_path), tuple(memories))
+        except OSError:
+            _PARSE_CACHE.pop(self.file_path, None)
+
+    def _migrate_legacy_file(self):
+        """One-time import of the old memory.json list into the JSONL log"""
+        if not os.path.exists(LEGACY_MEMORY_FILE):
             return []
         try:
-            with open(self.file_path, "r") as f:
-                return json.load(f)
-        except:
+            # Slurp the file and parse the bytes in one go
+            with open(LEGACY_MEMORY_FILE, "rb") as f:
+                memories = fast_json.loads(f.read())
+        except (OSError, ValueError):  # ValueError covers JSONDecodeError / bad encoding
             return []
+        self.memories = memories
+        self.save_memories()
+        return memories
 
     def save_memories(self):
-        with open(self.file_path, "w") as f:
-            json.dump(self.memories, f, indent=4)
+        """Rewrite the whole log (appends go through _append_memory)"""
+        # Encode first, then hand the file a single write
+        data = b"".join(fast_json.dumpb(mem) + b"\n" for mem in self.memories)
+        # Write a temp file and swap it in so a crash never leaves a half-written log
+        tmp_path = self.file_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.file_path)
+        self._update_parse_cache(self.memories)
+        self._pending = []
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def _append_memories(self, texts):
+        # The cache stays valid only if it described the file we are appending to
+        cached = _PARSE_CACHE.pop(self.file_path, None)
+        in_sync = cached is not None and os.path.exists(self.file_path) and cached[0] == _file_signature(self.file_path)
+        
+        with open(self.file_path, "ab") as f:
+            f.write(b"".join(fast_json.dumpb(text) + b"\n" for text in texts))
+        
+        if in_sync:
+            self._update_parse_cache(cached[1] + tuple(texts))
+
+    def flush(self):
+        """Write any buffered facts to disk now"""
+        with self._lock:
+            self._cancel_flush_timer()
+            if not self._dirty:
+                return
+            pending, self._pending = self._pending, []
+            self._dirty = False
+            self._last_flush = time.monotonic()
+            self._append_memories(pending)
+
+    def _maybe_flush(self):
+        """Flush now if the last flush is old enough, otherwise schedule one"""
+        if not self._dirty:
+            return
+        wait = FLUSH_INTERVAL - (time.monotonic() - self._last_flush)
+        if wait <= 0:
+            self.flush()
+        elif self._flush_timer is None:
+            # A lone fact is still written within FLUSH_INTERVAL, not only at exit
+            self._flush_timer = threading.Timer(wait, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _cancel_flush_timer(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def close(self):
+        self.flush()
 
     def add_memory(self, text):
         """Add a new fact to memory if it doesn't exist"""
-        if text not in self.memories:
-            self.memories.append(text)
-            self.save_memories()
-            return True
-        return False
+        with self._lock:
+            if text not in self._index:
+                self._index.add(text)
+                self.memories.append(text)
+                self.version += 1
+                self._cached_prompt = None
+                self._pending.append(text)
+                self._dirty = True
+                self._maybe_flush()
+                return True
+            return False
 
     def get_all_memories(self):
         return self.memories
 
     def get_memory_string(self):
         """Returns a formatted string of all memories for the LLM prompt"""
-        if not self.memories:
-            return "No known facts yet."
-        return "\n".join([f"- {mem}" for mem in self.memories])
+        if self._cached_prompt is None:
+            self._cached_prompt = "\n".join(f"- {mem}" for mem in self.memories) or "No known facts yet."
+        return self._cached_prompt
     
     def clear_all(self):
         """Clear all memories (useful for testing or reset)"""
-        self.memories = []
-        self.save_memories()
+        with self._lock:
+            self._cancel_flush_timer()
+            self.memories = []
+            self._index = set()
+            self.version += 1
+            self._cached_prompt = None
+            self.save_memories()
@@ -2,9 +2,11 @@ import edge_tts
 import pygame
 import asyncio
 import threading
+import queue
 import os
 import tempfile
 import time
+from concurrent.futures import Future
 from src.core.logger_config import get_logger
 
 logger = get_logger(__name__)
@@ -17,12 +19,19 @@ class TextToSpeech:
         # en-US-AriaNeural (American female)
         self.voice = "en-GB-RyanNeural" 
         
+        # Synthesis runs in parallel, but utterances play one at a time in the
+        # order speak() was called: each call queues a future for its audio file
+        self._playback_queue = queue.Queue()
+        
         try:
             pygame.mixer.init()
             self.audio_enabled = True
         except Exception as e:
             logger.info(f" Audio output not available: {e}")
             self.audio_enabled = False
+        
+        if self.audio_enabled:
+            threading.Thread(target=self._playback_loop, name="tts-playback", daemon=True).start()
 
     def speak(self, text):
         """
@@ -34,31 +43,41 @@ class TextToSpeech:
         
         if not self.audio_enabled: return
 
-        # Run in separate thread to avoid blocking
-        threading.Thread(target=self._run_speak, args=(text,)).start()
+        # Synthesize in a separate thread to avoid blocking
+        audio = Future()
+        self._playback_queue.put(audio)
+        threading.Thread(target=self._synthesize, args=(text, audio), daemon=True).start()
 
-    def _run_speak(self, text):
+    def _synthesize(self, text, audio):
+        # Unique temp file for this utterance (mkstemp can't collide)
+        fd, temp_file = tempfile.mkstemp(prefix="jarvis_speech_", suffix=".mp3")
+        os.close(fd)
         try:
-            # Create a unique temp file for this utterance to avoid conflicts
-            # timestamp to ensure uniqueness
-            filename = f"jarvis_speech_{int(time.time()*1000)}.mp3"
-            temp_file = os.path.join(tempfile.gettempdir(), filename)
-            
             # Generate audio (needs asyncio loop)
             asyncio.run(self._generate_audio(text, temp_file))
+            audio.set_result(temp_file)
+        except Exception as e:
+            logger.error(f" TTS Error: {e}")
+            audio.set_result(None)  # Keep the queue moving
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+    def _playback_loop(self):
+        """Single consumer: plays queued utterances one after another"""
+        while True:
+            temp_file = self._playback_queue.get().result()
+            if temp_file is None:
+                continue
             
-            # Play audio
             self._play_audio(temp_file)
             
             # Cleanup
             try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except:
+                os.remove(temp_file)
+            except OSError:
                 pass
-                
-        except Exception as e:
-            logger.error(f" TTS Error: {e}")
 
     async def _generate_audio(self, text, output_file):
         communicate = edge_tts.Communicate(text, self.voice)
@@ -4,6 +4,7 @@ Application registry - paths and commands for common applications
 
 import os
 import platform
+import subprocess
 from pathlib import Path
 
 # Cross-platform application paths
@@ -122,25 +123,65 @@ APPLICATIONS = {
     }
 }
 
+# Executable paths already found on disk, by application key
+_resolved_paths = {}
+
 def find_application_path(app_name):
     """
     Find the actual path of an application
     
+    Found paths are remembered, so only the first lookup probes the
+    filesystem. Misses are not cached, so an app installed while the
+    assistant runs is still picked up.
+    
     Args:
         app_name: Application key from APPLICATIONS dict
         
     Returns:
         Path to executable or None if not found
     """
-    if app_name not in APPLICATIONS:
-        return None
+    path = _resolved_paths.get(app_name)
+    if path is not None or app_name not in APPLICATIONS:
+        return path
     
     for path in APPLICATIONS[app_name]["paths"]:
         if os.path.exists(path):
+            _resolved_paths[app_name] = path
             return path
     
     return None
 
+def preload_application_paths():
+    """Resolve every known application once, ahead of the first request"""
+    for app_key in APPLICATIONS:
+        find_application_path(app_key)
+
+def launch_application(path):
+    """
+    Start an application detached from the assistant
+    
+    On POSIX the app gets its own session (a Ctrl+C in the assistant's
+    terminal no longer reaches it) and no inherited stdio. The session
+    rules out posix_spawn, but with no preexec_fn CPython (3.10+ on Linux)
+    still starts the child with vfork rather than copying the assistant's
+    large address space (Whisper, LLM client, etc.) with fork.
+    
+    Args:
+        path: Absolute path to the executable
+        
+    Returns:
+        subprocess.Popen handle for the launched process
+    """
+    if os.name == "posix":
+        return subprocess.Popen(
+            [path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+    return subprocess.Popen(path)
+
 def get_app_from_alias(alias):
     """
     Get application key from alias
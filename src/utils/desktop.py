@@ -0,0 +1,12 @@
+"""
+Desktop automation (pyautogui), imported in one place for every module
+that presses keys or takes screenshots
+
+pyautogui is optional: it may not be installed, and importing it fails when
+there is no display to attach to (headless session). `pyautogui` is None then.
+"""
+
+try:
+    import pyautogui
+except Exception:
+    pyautogui = None
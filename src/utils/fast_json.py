@@ -0,0 +1,31 @@
+"""
+JSON helpers - use orjson when it is installed, fall back to the stdlib json module
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch either this or json.JSONDecodeError regardless of the backend
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    def loads(data):
+        """Parse JSON from str or bytes"""
+        return orjson.loads(data)
+
+    def dumpb(obj):
+        """Serialize to compact UTF-8 JSON bytes"""
+        return orjson.dumps(obj)
+else:
+    def loads(data):
+        """Parse JSON from str or bytes"""
+        return json.loads(data)
+
+    def dumpb(obj):
+        """Serialize to compact UTF-8 JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
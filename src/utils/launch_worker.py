@@ -0,0 +1,191 @@
+"""
+Launch worker - small helper process that starts apps and opens URLs
+
+The assistant process is large (Whisper, LLM client, ML libraries). Every
+spawn from it copies its page tables and file descriptors, so a burst of
+"open X" commands becomes a burst of expensive forks. This helper is
+started once, stays tiny, and does the spawning instead.
+
+Protocol: one JSON object per line on stdin, one JSON reply per line on
+stdout. Runs as a plain script (stdlib only) so it starts quickly.
+"""
+
+import atexit
+import json
+import os
+import select
+import signal
+import subprocess
+import sys
+import threading
+import webbrowser
+
+
+def _handle(request):
+    cmd = request.get("cmd")
+    if cmd == "launch":
+        proc = subprocess.Popen(
+            [request["path"]],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+            start_new_session=True
+        )
+        return {"ok": True, "pid": proc.pid}
+    if cmd == "open_url":
+        return {"ok": bool(webbrowser.open(request["url"]))}
+    return {"ok": False, "error": f"Unknown command: {cmd}"}
+
+
+def main():
+    # Replies go to a private copy of the stdout pipe; fd 1 and 2 point at
+    # /dev/null so nothing a library or browser helper prints can corrupt
+    # the protocol stream (os.dup'd fds are not inherited by children)
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    os.close(devnull)
+
+    # Exited apps are reaped by the kernel; the assistant tracks them by pidfd
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    for line in sys.stdin:
+        try:
+            reply = _handle(json.loads(line))
+        except Exception as e:
+            reply = {"ok": False, "error": str(e)}
+        replies.write(json.dumps(reply) + "\n")
+        replies.flush()
+
+
+class WorkerProcess:
+    """
+    Popen-like handle for an app started by the launch worker
+
+    The app is not our child, so it is tracked through a pidfd opened right
+    after launch: unlike a bare pid, a pidfd keeps referring to the same
+    process even once its pid is reused. Without pidfd support (non-Linux,
+    old kernel) this falls back to probing the pid.
+    """
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.returncode = None
+        try:
+            self._pidfd = os.pidfd_open(pid)
+        except ProcessLookupError:
+            self._pidfd = None
+            self.returncode = 0  # Already gone
+        except (AttributeError, OSError):
+            self._pidfd = None
+
+    def poll(self):
+        """None while the app runs; 0 once it has exited (exit code is unknown)"""
+        if self.returncode is not None:
+            return self.returncode
+
+        if self._pidfd is not None:
+            # A pidfd turns readable when its process exits
+            if select.select([self._pidfd], [], [], 0)[0]:
+                self._exited()
+            return self.returncode
+
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            self.returncode = 0
+        except PermissionError:
+            pass  # Exists, owned by someone else
+        return self.returncode
+
+    def terminate(self):
+        self._send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self._send_signal(signal.SIGKILL)
+
+    def _send_signal(self, sig):
+        if self.poll() is not None:
+            return  # Never signal a pid that may now belong to another process
+        if self._pidfd is not None:
+            signal.pidfd_send_signal(self._pidfd, sig)
+        else:
+            os.kill(self.pid, sig)
+
+    def _exited(self):
+        self.returncode = 0
+        os.close(self._pidfd)
+        self._pidfd = None
+
+    def __del__(self):
+        if getattr(self, "_pidfd", None) is not None:
+            os.close(self._pidfd)
+
+
+class LaunchWorker:
+    """Assistant-side client; the worker process is started on first use"""
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def launch(self, path):
+        """Start an executable; returns a WorkerProcess handle"""
+        reply = self._request({"cmd": "launch", "path": path})
+        if not reply.get("ok"):
+            raise OSError(reply.get("error", f"Could not launch {path}"))
+        return WorkerProcess(reply["pid"])
+
+    def open_url(self, url):
+        """Open a URL in the default browser"""
+        return self._request({"cmd": "open_url", "url": url}).get("ok", False)
+
+    def close(self):
+        """Stop the worker; it exits once its stdin reaches EOF"""
+        with self._lock:
+            self._discard()
+
+    def _request(self, command):
+        line = (json.dumps(command) + "\n").encode("utf-8")
+        with self._lock:
+            # A worker that died is restarted once per request
+            for _ in range(2):
+                proc = self._ensure_started()
+                try:
+                    proc.stdin.write(line)
+                    proc.stdin.flush()
+                    reply = proc.stdout.readline()
+                    if reply:
+                        return json.loads(reply)
+                except (OSError, ValueError):
+                    # Broken pipe, closed file or a garbled reply: the stream
+                    # can't be trusted any more, so start a fresh worker
+                    pass
+                self._discard()
+        raise RuntimeError("Launch worker is not responding")
+
+    def _ensure_started(self):
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                start_new_session=True
+            )
+        return self._proc
+
+    def _discard(self):
+        if self._proc is not None:
+            for pipe in (self._proc.stdin, self._proc.stdout):
+                try:
+                    pipe.close()
+                except OSError:
+                    pass
+            self._proc = None
+
+
+if __name__ == "__main__":
+    main()
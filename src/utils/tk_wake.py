@@ -0,0 +1,85 @@
+"""
+Queue that wakes a Tk mainloop from worker threads
+
+Tk may only be touched from the thread running its mainloop, and
+event_generate() from another thread is not safe on every Tcl build. On
+POSIX, put() writes a byte to a self-pipe that Tk watches with
+createfilehandler, so the mainloop wakes the moment an update is posted
+and sleeps otherwise. Where Tk can't watch file descriptors (Windows) it
+falls back to polling with after().
+"""
+
+import os
+import queue
+import tkinter
+
+# Poll interval (ms) when Tk can't watch the wake pipe
+FALLBACK_POLL_MS = 100
+
+
+class TkWakeQueue:
+    """Thread-safe queue drained by `on_wake` on the Tk thread"""
+
+    def __init__(self, root, on_wake):
+        self._root = root
+        self._on_wake = on_wake
+        self._queue = queue.SimpleQueue()
+        self._read_fd = self._write_fd = None
+
+        try:
+            read_fd, write_fd = os.pipe()
+        except OSError:
+            read_fd = write_fd = None
+        if read_fd is not None:
+            try:
+                os.set_blocking(read_fd, False)
+                os.set_blocking(write_fd, False)
+                root.tk.createfilehandler(read_fd, tkinter.READABLE, self._on_readable)
+                self._read_fd, self._write_fd = read_fd, write_fd
+            except (AttributeError, OSError, tkinter.TclError):
+                # No file handlers on this platform
+                os.close(read_fd)
+                os.close(write_fd)
+
+        if self._read_fd is None:
+            root.after(FALLBACK_POLL_MS, self._poll)
+
+    def put(self, msg):
+        """Queue an update from any thread and wake the mainloop"""
+        self._queue.put(msg)
+        self.wake()
+
+    def wake(self):
+        """Wake the mainloop without queueing anything (e.g. after setting a latest-value field)"""
+        if self._write_fd is None:
+            return
+        try:
+            os.write(self._write_fd, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Pipe full: a wake-up is already pending, or we're closing
+
+    def get_nowait(self):
+        return self._queue.get_nowait()
+
+    def close(self):
+        if self._read_fd is not None:
+            try:
+                self._root.tk.deletefilehandler(self._read_fd)
+            except tkinter.TclError:
+                pass
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+            self._read_fd = self._write_fd = None
+
+    def _on_readable(self, fd, mask):
+        # One read swallows every wake-up posted since the last drain
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._on_wake()
+
+    def _poll(self):
+        self._on_wake()
+        self._root.after(FALLBACK_POLL_MS, self._poll)
@@ -36,7 +36,8 @@ class VADDetector:
         Returns:
             Energy value
         """
-        return np.sum(np.abs(audio_frame))
+        # Single int32 temporary (also avoids int16 overflow on abs(-32768))
+        return int(np.absolute(audio_frame, dtype=np.int32).sum())
     
     def is_speech(self, audio_frame):
         """
@@ -86,12 +87,13 @@ class VADDetector:
             audio_samples: Audio data to analyze
             percentile: Percentile for threshold
         """
-        energies = []
-        for i in range(0, len(audio_samples) - self.frame_size, self.frame_size):
-            frame = audio_samples[i:i + self.frame_size]
-            energies.append(self.calculate_energy(frame))
+        # Same frames as stepping i in range(0, len - frame_size, frame_size),
+        # computed in one vectorized pass over a (frames, frame_size) view
+        num_frames = len(range(0, len(audio_samples) - self.frame_size, self.frame_size))
+        frames = audio_samples[:num_frames * self.frame_size].reshape(num_frames, self.frame_size)
+        energies = np.absolute(frames, dtype=np.int32).sum(axis=1)
         
-        if energies:
+        if num_frames:
             # Use a higher percentile to avoid triggering on random spikes
             noise_level = np.percentile(energies, percentile)
             # Set threshold slightly above noise level